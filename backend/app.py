@@ -3,13 +3,21 @@ Hallucination Detector Backend
 Flask API for text cleaning and claim extraction using Ollama LLM
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, request, send_file
 from flask_cors import CORS
-from text_cleaner import TextCleaner
+from text_cleaner import TextCleaner, clean_many
 from claim_extractor import ClaimExtractor
+from async_extractor import AsyncClaimExtractor
+from batcher import ClaimBatcher
+from background_loop import background_loop
+from writer import writer
+import functools
 import logging
-import json
+import msgspec
+import orjson
 import os
+import threading
+import time
 from datetime import datetime
 from dotenv import load_dotenv
 
@@ -26,16 +34,23 @@ CORS(app)  # Enable CORS for frontend communication
 # Initialize components
 text_cleaner = TextCleaner()
 claim_extractor = ClaimExtractor()
+async_claim_extractor = AsyncClaimExtractor()
 
-# Lazy load verifier (only when needed)
+# Single-text extractions that arrive together share one packed prompt
+claim_batcher = ClaimBatcher(claim_extractor)
+
+# Lazy load verifier (only when needed; gunicorn warms it per worker)
 claim_verifier = None
+claim_verifier_lock = threading.Lock()
 
 def get_claim_verifier():
     global claim_verifier
     if claim_verifier is None:
-        from claim_verifier import ClaimVerifier
-        # Use Ollama (local LLM) - no API key needed
-        claim_verifier = ClaimVerifier()
+        with claim_verifier_lock:
+            if claim_verifier is None:
+                from claim_verifier import ClaimVerifier
+                # Use Ollama (local LLM) - no API key needed
+                claim_verifier = ClaimVerifier()
     return claim_verifier
 
 # Output directory for claims JSON
@@ -43,10 +58,50 @@ OUTPUT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 CLAIMS_FILE = os.path.join(OUTPUT_DIR, 'extracted_claims.json')
 VERIFIED_FILE = os.path.join(OUTPUT_DIR, 'verified_claims.json')
 
+# Most texts accepted by one batch request
+MAX_BATCH_TEXTS = 64
+
+
+@functools.lru_cache(maxsize=512)
+def _clean_text_cached(text):
+    return text_cleaner.clean(text)
+
+
+def clean_text_cached(text):
+    """Clean text, reusing the result when the same text is resubmitted"""
+    if not isinstance(text, str):
+        return text_cleaner.clean(text)
+    return _clean_text_cached(text)
+
+
+def texts_error(data):
+    """Why a batch request body has no usable "texts" list, or None if it does"""
+    texts = data.get('texts') if isinstance(data, dict) else None
+    if not isinstance(texts, list) or not texts:
+        return 'No texts provided'
+    if len(texts) > MAX_BATCH_TEXTS:
+        return f'Too many texts (at most {MAX_BATCH_TEXTS} per request)'
+    if not all(isinstance(text, str) for text in texts):
+        return 'texts must be a list of strings'
+    return None
+
+
+def json_response(payload):
+    """Encode payload (dicts and ExtractionResult structs) into a JSON response"""
+    return app.response_class(msgspec.json.encode(payload), mimetype='application/json')
+
+
+def read_json_file(path):
+    """Read a JSON file in one unbuffered read"""
+    with open(path, 'rb', buffering=0) as f:
+        return orjson.loads(f.read())
+
 
 def save_claims_to_file(claims, cleaned_text, processing_time):
     """Save extracted claims to JSON file"""
+    # Stored with 'success' so GET /api/claims can serve the file as-is
     data = {
+        'success': True,
         'timestamp': datetime.now().isoformat(),
         'cleaned_text': cleaned_text,
         'total_claims': len(claims),
@@ -54,16 +109,15 @@ def save_claims_to_file(claims, cleaned_text, processing_time):
         'claims': claims
     }
     
-    with open(CLAIMS_FILE, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    writer.submit(CLAIMS_FILE, orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE))
     
-    logger.info(f"Claims saved to {CLAIMS_FILE}")
+    logger.info(f"Claims queued for {CLAIMS_FILE}")
 
 
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
-    return jsonify({
+    return json_response({
         'status': 'healthy',
         'message': 'Hallucination Detector API is running'
     })
@@ -91,15 +145,15 @@ def clean_text():
         data = request.get_json()
         
         if not data or 'text' not in data:
-            return jsonify({
+            return json_response({
                 'success': False,
                 'error': 'No text provided'
             }), 400
         
         original_text = data['text']
-        cleaned_text = text_cleaner.clean(original_text)
+        cleaned_text = clean_text_cached(original_text)
         
-        return jsonify({
+        return json_response({
             'success': True,
             'original_length': len(original_text),
             'cleaned_length': len(cleaned_text),
@@ -108,7 +162,7 @@ def clean_text():
         
     except Exception as e:
         logger.error(f"Error cleaning text: {str(e)}")
-        return jsonify({
+        return json_response({
             'success': False,
             'error': str(e)
         }), 500
@@ -122,7 +176,8 @@ def extract_claims():
     Request body:
     {
         "text": "Your text here...",
-        "clean_first": true  // Optional, default true
+        "clean_first": true,  // Optional, default true
+        "num_predict": 512    // Optional, max tokens to generate
     }
     
     Returns:
@@ -144,7 +199,7 @@ def extract_claims():
         data = request.get_json()
         
         if not data or 'text' not in data:
-            return jsonify({
+            return json_response({
                 'success': False,
                 'error': 'No text provided'
             }), 400
@@ -154,16 +209,137 @@ def extract_claims():
         
         # Clean text if requested
         if clean_first:
-            text = text_cleaner.clean(text)
+            text = clean_text_cached(text)
+        
+        num_predict = data.get('num_predict')
+        if num_predict is not None:
+            try:
+                num_predict = max(1, int(num_predict))
+            except (TypeError, ValueError):
+                return json_response({
+                    'success': False,
+                    'error': 'num_predict must be an integer'
+                }), 400
         
-        # Extract claims using LLM
-        result = claim_extractor.extract_claims(text)
+        # Extract claims using LLM (an explicit token limit skips batching)
+        if num_predict is None:
+            result = claim_batcher.submit(text)
+        else:
+            result = claim_extractor.extract_claims(text, num_predict=num_predict)
         
-        return jsonify(result)
+        return json_response(result)
         
     except Exception as e:
         logger.error(f"Error extracting claims: {str(e)}")
-        return jsonify({
+        return json_response({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
+@app.route('/api/extract-claims-batch', methods=['POST'])
+def extract_claims_batch():
+    """
+    Endpoint to extract claims from several texts concurrently
+    
+    Request body:
+    {
+        "texts": ["First text...", "Second text..."],  // At most MAX_BATCH_TEXTS
+        "clean_first": true  // Optional, default true
+    }
+    
+    Returns:
+    {
+        "success": true,
+        "results": [ ...one /api/extract-claims result per text... ],
+        "total_texts": 2,
+        "processing_time": 4.1
+    }
+    """
+    try:
+        start_time = time.time()
+        data = request.get_json()
+        
+        error = texts_error(data)
+        if error:
+            return json_response({
+                'success': False,
+                'error': error
+            }), 400
+        
+        texts = data['texts']
+        if data.get('clean_first', True):
+            texts = clean_many(texts, clean_one=clean_text_cached)
+        
+        # Fan out to Ollama on the shared loop; requests overlap when
+        # OLLAMA_NUM_PARALLEL > 1
+        results = background_loop.run(async_claim_extractor.extract_claims_batch(texts))
+        
+        return json_response({
+            'success': True,
+            'results': results,
+            'total_texts': len(results),
+            'processing_time': round(time.time() - start_time, 2)
+        })
+        
+    except Exception as e:
+        logger.error(f"Error extracting claims batch: {str(e)}")
+        return json_response({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
+@app.route('/api/extract-claims-packed', methods=['POST'])
+def extract_claims_packed():
+    """
+    Endpoint to extract claims from several texts, packing them into
+    shared prompts so Ollama runs fewer forward passes
+    
+    Request body:
+    {
+        "texts": ["First text...", "Second text..."],  // At most MAX_BATCH_TEXTS
+        "k": 4,              // Optional, max texts per prompt
+        "clean_first": true  // Optional, default true
+    }
+    
+    Returns the same shape as /api/extract-claims-batch
+    """
+    try:
+        start_time = time.time()
+        data = request.get_json()
+        
+        error = texts_error(data)
+        if error:
+            return json_response({
+                'success': False,
+                'error': error
+            }), 400
+        
+        try:
+            k = max(1, int(data.get('k', 4)))
+        except (TypeError, ValueError):
+            return json_response({
+                'success': False,
+                'error': 'k must be an integer'
+            }), 400
+        
+        texts = data['texts']
+        if data.get('clean_first', True):
+            texts = clean_many(texts, clean_one=clean_text_cached)
+        
+        results = claim_extractor.extract_claims_packed(texts, k=k)
+        
+        return json_response({
+            'success': True,
+            'results': results,
+            'total_texts': len(results),
+            'processing_time': round(time.time() - start_time, 2)
+        })
+        
+    except Exception as e:
+        logger.error(f"Error extracting packed claims: {str(e)}")
+        return json_response({
             'success': False,
             'error': str(e)
         }), 500
@@ -185,7 +361,7 @@ def analyze_text():
         data = request.get_json()
         
         if not data or 'text' not in data:
-            return jsonify({
+            return json_response({
                 'success': False,
                 'error': 'No text provided'
             }), 400
@@ -193,32 +369,32 @@ def analyze_text():
         original_text = data['text']
         
         # Step 1: Clean the text
-        cleaned_text = text_cleaner.clean(original_text)
+        cleaned_text = clean_text_cached(original_text)
         
         # Step 2: Extract claims
-        extraction_result = claim_extractor.extract_claims(cleaned_text)
+        extraction_result = claim_batcher.submit(cleaned_text)
         
         # Step 3: Save claims to JSON file
-        if extraction_result.get('success'):
+        if extraction_result.success:
             save_claims_to_file(
-                extraction_result.get('claims', []),
+                extraction_result.claims,
                 cleaned_text,
-                extraction_result.get('processing_time', 0)
+                extraction_result.processing_time
             )
         
-        return jsonify({
+        return json_response({
             'success': True,
             'original_text_length': len(original_text),
             'cleaned_text_length': len(cleaned_text),
             'cleaned_text': cleaned_text,
-            'claims': extraction_result.get('claims', []),
-            'total_claims': extraction_result.get('total_claims', 0),
-            'processing_time': extraction_result.get('processing_time', 0)
+            'claims': extraction_result.claims,
+            'total_claims': extraction_result.total_claims,
+            'processing_time': extraction_result.processing_time
         })
         
     except Exception as e:
         logger.error(f"Error in analysis: {str(e)}")
-        return jsonify({
+        return json_response({
             'success': False,
             'error': str(e)
         }), 500
@@ -244,44 +420,43 @@ def verify_claims():
         
         # If no claims provided, load from extracted_claims.json
         if not claims:
+            writer.flush()  # let a just-queued write land first
             if not os.path.exists(CLAIMS_FILE):
-                return jsonify({
+                return json_response({
                     'success': False,
                     'error': 'No claims provided and no extracted_claims.json found. Run /api/analyze first.'
                 }), 400
             
-            with open(CLAIMS_FILE, 'r', encoding='utf-8') as f:
-                extracted = json.load(f)
-                claims = extracted.get('claims', [])
+            extracted = read_json_file(CLAIMS_FILE)
+            claims = extracted.get('claims', [])
         
         if not claims:
-            return jsonify({
+            return json_response({
                 'success': False,
                 'error': 'No claims to verify'
             }), 400
         
         # Verify all claims
-        verification_result = verifier.verify_all_claims(claims)
+        verification_result = {
+            'success': True,
+            **verifier.verify(claims)
+        }
         
-        # Save to verified_claims.json
-        with open(VERIFIED_FILE, 'w', encoding='utf-8') as f:
-            json.dump(verification_result, f, indent=2, ensure_ascii=False)
+        # Save to verified_claims.json (served as-is by GET /api/verified)
+        writer.submit(VERIFIED_FILE, orjson.dumps(verification_result, option=orjson.OPT_APPEND_NEWLINE))
         
-        logger.info(f"Verification complete. Results saved to {VERIFIED_FILE}")
+        logger.info(f"Verification complete. Results queued for {VERIFIED_FILE}")
         
-        return jsonify({
-            'success': True,
-            **verification_result
-        })
+        return json_response(verification_result)
         
     except ValueError as e:
-        return jsonify({
+        return json_response({
             'success': False,
             'error': str(e)
         }), 400
     except Exception as e:
         logger.error(f"Error in verification: {str(e)}")
-        return jsonify({
+        return json_response({
             'success': False,
             'error': str(e)
         }), 500
@@ -291,22 +466,18 @@ def verify_claims():
 def get_claims():
     """Get the extracted claims from JSON file"""
     try:
+        writer.flush()  # let a just-queued write land first
         if not os.path.exists(CLAIMS_FILE):
-            return jsonify({
+            return json_response({
                 'success': False,
                 'error': 'No extracted claims found. Run /api/analyze first.'
             }), 404
         
-        with open(CLAIMS_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        return jsonify({
-            'success': True,
-            **data
-        })
+        # Stream the stored file; conditional requests get a 304
+        return send_file(CLAIMS_FILE, mimetype='application/json', conditional=True)
         
     except Exception as e:
-        return jsonify({
+        return json_response({
             'success': False,
             'error': str(e)
         }), 500
@@ -316,22 +487,18 @@ def get_claims():
 def get_verified():
     """Get the verified claims from JSON file"""
     try:
+        writer.flush()  # let a just-queued write land first
         if not os.path.exists(VERIFIED_FILE):
-            return jsonify({
+            return json_response({
                 'success': False,
                 'error': 'No verified claims found. Run /api/verify first.'
             }), 404
         
-        with open(VERIFIED_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        return jsonify({
-            'success': True,
-            **data
-        })
+        # Stream the stored file; conditional requests get a 304
+        return send_file(VERIFIED_FILE, mimetype='application/json', conditional=True)
         
     except Exception as e:
-        return jsonify({
+        return json_response({
             'success': False,
             'error': str(e)
         }), 500
@@ -341,11 +508,14 @@ if __name__ == '__main__':
     print("=" * 50)
     print("🔍 Hallucination Detector Backend (Ollama)")
     print("=" * 50)
-    print("Starting server on http://localhost:5000")
+    print("Starting development server on http://localhost:5000")
+    print("For production: gunicorn -c gunicorn.conf.py app:app")
     print("Endpoints:")
     print("  GET  /health          - Health check")
     print("  POST /api/clean-text  - Clean input text")
     print("  POST /api/extract-claims - Extract claims from text")
+    print("  POST /api/extract-claims-batch - Extract claims from many texts")
+    print("  POST /api/extract-claims-packed - Same, packed into shared prompts")
     print("  POST /api/analyze     - Full analysis pipeline")
     print("  POST /api/verify      - Verify extracted claims")
     print("  GET  /api/claims      - Get extracted claims")
@@ -353,6 +523,7 @@ if __name__ == '__main__':
     print("=" * 50)
     print("✓ Using Ollama (llama3.2:3b) for all LLM tasks")
     print("  Make sure Ollama is running: ollama serve")
+    print("  For concurrent batches: OLLAMA_NUM_PARALLEL=8 ollama serve")
     print("=" * 50)
     
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    app.run(host='0.0.0.0', port=5000)
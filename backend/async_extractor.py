@@ -0,0 +1,130 @@
+"""
+Async Claim Extractor Module
+Fans out claim extraction over Ollama's AsyncClient so several texts are
+processed concurrently. Ollama only overlaps the requests when the server
+is started with OLLAMA_NUM_PARALLEL > 1 (e.g. OLLAMA_NUM_PARALLEL=8 ollama serve).
+"""
+
+import asyncio
+import os
+import time
+import logging
+
+from ollama import AsyncClient, ResponseError
+
+from background_loop import SingleFlight
+from claim_extractor import ClaimExtractor, ExtractionResult, CLAIMS_SCHEMA, OLLAMA_NUM_PARALLEL
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncClaimExtractor(ClaimExtractor):
+    """
+    Claim extractor backed by the async Ollama client
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._client = None
+        self._client_pid = None
+        
+        # At most OLLAMA_NUM_PARALLEL generations in flight; Ollama would
+        # queue the rest, and time spent queued counts against the timeout
+        self._ollama_slots = asyncio.Semaphore(OLLAMA_NUM_PARALLEL)
+        
+        # Identical concurrent texts share one Ollama call
+        self._inflight = SingleFlight()
+    
+    @property
+    def client(self) -> AsyncClient:
+        """
+        AsyncClient shared by every call in this process
+        
+        The API runs all async extraction on the shared background loop,
+        which is one per process, so one client (and its connection pool)
+        serves every request. A forked child starts its own.
+        """
+        if self._client is None or self._client_pid != os.getpid():
+            self._client = AsyncClient(host=self.ollama_url, timeout=120)
+            self._client_pid = os.getpid()
+        return self._client
+    
+    async def extract_claims_async(self, text: str) -> ExtractionResult:
+        """
+        Extract claims from text without blocking the event loop
+        
+        Args:
+            text: The text to analyze
+        
+        Returns:
+            ExtractionResult with the claims and metadata
+        """
+        key = self.cache_key(text)
+        cached = self.get_cached(key)
+        if cached is not None:
+            return cached
+        
+        return await self._inflight.run(key, lambda: self._extract_claims_async(text, key))
+    
+    async def _extract_claims_async(self, text: str, key: bytes) -> ExtractionResult:
+        start_time = time.time()
+        prompt = self.create_extraction_prompt(text)
+        
+        try:
+            async with self._ollama_slots:
+                response = await self.client.generate(
+                    model=self.model,
+                    prompt=prompt,
+                    format=CLAIMS_SCHEMA,
+                    options={
+                        'temperature': 0.1,
+                        'num_predict': self.estimate_num_predict(text),
+                        'stop': self.STOP_SEQUENCES,
+                    }
+                )
+            
+            parsed = self.parse_llm_response(response['response'])
+            claims = parsed.get('claims', [])
+            
+            result = ExtractionResult(
+                success=True,
+                claims=claims,
+                total_claims=len(claims),
+                processing_time=round(time.time() - start_time, 2),
+                model_used=self.model
+            )
+            # An unparseable (e.g. truncated) reply is returned but not cached
+            if not parsed.get('parse_error'):
+                self.set_cached(key, result)
+            return result
+        
+        except ResponseError as e:
+            return ExtractionResult(
+                success=False,
+                error=f'Ollama API error: {e.status_code}',
+                claims=[],
+                total_claims=0,
+                processing_time=time.time() - start_time
+            )
+        except Exception as e:
+            logger.error(f"Unexpected error in async claim extraction: {str(e)}")
+            return ExtractionResult(
+                success=False,
+                error=f'Request failed: {str(e)}',
+                claims=[],
+                total_claims=0,
+                processing_time=time.time() - start_time
+            )
+    
+    async def extract_claims_batch(self, texts: list) -> list:
+        """
+        Extract claims from several texts concurrently (at most
+        OLLAMA_NUM_PARALLEL generate calls at a time)
+        
+        Args:
+            texts: The texts to analyze
+        
+        Returns:
+            One ExtractionResult per text, in input order
+        """
+        return await asyncio.gather(*[self.extract_claims_async(t) for t in texts])
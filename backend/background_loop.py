@@ -0,0 +1,84 @@
+"""
+Background Loop Module
+Shared asyncio plumbing: one event loop per process, run on a daemon
+thread and used by every async component (claim batcher, batch
+extraction, claim verifier), and a helper that lets identical concurrent
+calls share one in-flight task
+
+Under gunicorn's gevent workers that thread is a greenlet on the main OS
+thread, and asyncio allows only one running loop per OS thread, so a
+second private loop (or asyncio.run in a request) would fail. Sync code
+hands coroutines to this loop with run() instead.
+"""
+
+import asyncio
+import os
+import threading
+
+
+class BackgroundLoop:
+    """
+    Lazily started event loop on a daemon thread
+    """
+    
+    def __init__(self, name: str = 'async-loop'):
+        self.name = name
+        self._loop = None
+        self._pid = None
+        self._lock = threading.Lock()
+    
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The running loop, started on first use in each process"""
+        with self._lock:
+            # A loop inherited through fork has no thread running it
+            if self._loop is None or self._pid != os.getpid():
+                self._loop = asyncio.new_event_loop()
+                self._pid = os.getpid()
+                threading.Thread(target=self._loop.run_forever, name=self.name, daemon=True).start()
+            return self._loop
+    
+    def run(self, coro):
+        """
+        Run a coroutine on the loop and wait for its result
+        
+        Args:
+            coro: Coroutine to run
+        
+        Returns:
+            Whatever the coroutine returns (its exception is re-raised)
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+
+class SingleFlight:
+    """
+    Shares one in-flight task among identical concurrent calls
+    """
+    
+    def __init__(self):
+        # Tasks keyed by (event loop, key), since a task belongs to one loop
+        self._inflight = {}
+    
+    async def run(self, key, make_coro):
+        """
+        Await the task already running for key, or start one
+        
+        Args:
+            key: Hashable identity of the call
+            make_coro: Zero-argument callable returning the coroutine to run
+        
+        Returns:
+            The task's result (shared by every caller with the same key)
+        """
+        inflight_key = (asyncio.get_running_loop(), key)
+        task = self._inflight.get(inflight_key)
+        if task is None:
+            task = asyncio.ensure_future(make_coro())
+            self._inflight[inflight_key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(inflight_key, None))
+        return await asyncio.shield(task)
+
+
+# Shared loop used by the API
+background_loop = BackgroundLoop()
@@ -0,0 +1,127 @@
+"""
+Claim Batcher Module
+Collects extraction requests that arrive within a short window and sends
+them to Ollama together as one packed prompt
+"""
+
+import asyncio
+import logging
+
+from background_loop import BackgroundLoop, SingleFlight, background_loop
+from claim_extractor import ClaimExtractor, ExtractionResult
+
+logger = logging.getLogger(__name__)
+
+
+class ClaimBatcher:
+    """
+    Micro-batching front end for a ClaimExtractor
+    
+    Request threads call submit(); the shared background loop gathers up to
+    max_batch pending texts (waiting at most timeout_ms after the first)
+    and extracts them with a single packed prompt.
+    """
+    
+    def __init__(self,
+                 extractor: ClaimExtractor,
+                 max_batch: int = 8,
+                 timeout_ms: int = 10,
+                 runner: BackgroundLoop = background_loop):
+        """
+        Initialize the batcher
+        
+        Args:
+            extractor: Extractor used to run each batch
+            max_batch: Maximum number of texts per batch
+            timeout_ms: How long to wait for more texts after the first
+            runner: Background loop the batches are formed and run on
+        """
+        self.extractor = extractor
+        self.max_batch = max_batch
+        self.timeout = timeout_ms / 1000
+        self.runner = runner
+        self._queue = None
+        self._queue_loop = None
+        
+        # Identical concurrent requests share one queued extraction
+        self._inflight = SingleFlight()
+    
+    def submit(self, text: str) -> ExtractionResult:
+        """
+        Extract claims from text as part of the next batch
+        
+        Args:
+            text: The text to analyze
+        
+        Returns:
+            ExtractionResult for this text
+        """
+        return self.runner.run(self._submit(text))
+    
+    def _ensure_collecting(self) -> asyncio.Queue:
+        # The queue and its collector belong to the loop they were made on
+        loop = asyncio.get_running_loop()
+        if self._queue_loop is not loop:
+            self._queue = asyncio.Queue()
+            self._queue_loop = loop
+            loop.create_task(self._collect(self._queue))
+        return self._queue
+    
+    async def _submit(self, text: str) -> ExtractionResult:
+        key = self.extractor.cache_key(text)
+        return await self._inflight.run(key, lambda: self._enqueue(text))
+    
+    async def _enqueue(self, text: str) -> ExtractionResult:
+        queue = self._ensure_collecting()
+        future = asyncio.get_running_loop().create_future()
+        await queue.put((text, future))
+        return await future
+    
+    async def _collect(self, queue: asyncio.Queue):
+        """Form batches from the queue until the loop stops"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.timeout
+            
+            while len(batch) < self.max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            
+            # Run the batch in the background so the next one can form
+            loop.create_task(self._run_batch(batch))
+    
+    async def _run_batch(self, batch: list):
+        loop = asyncio.get_running_loop()
+        texts = [text for text, _ in batch]
+        
+        def on_result(index, result):
+            # Wake each caller as soon as its own text is done, not when
+            # the whole batch (including any retries) is
+            loop.call_soon_threadsafe(self._resolve, batch[index][1], result)
+        
+        try:
+            await asyncio.to_thread(self._extract, texts, on_result)
+        except Exception as e:
+            logger.error(f"Batch extraction failed: {str(e)}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+    
+    @staticmethod
+    def _resolve(future: asyncio.Future, result: ExtractionResult):
+        if not future.done():
+            future.set_result(result)
+    
+    def _extract(self, texts: list, on_result) -> list:
+        if len(texts) == 1:
+            result = self.extractor.extract_claims(texts[0])
+            on_result(0, result)
+            return [result]
+        logger.info(f"Extracting a batch of {len(texts)} texts")
+        return self.extractor.extract_claims_packed(texts, k=self.max_batch, on_result=on_result)
@@ -3,64 +3,168 @@ Claim Extractor Module
 Uses Ollama LLM to extract verifiable claims from text
 """
 
+import hashlib
 import json
+import msgspec
+import orjson
+import os
+import re
+import socket
+import threading
 import time
 import requests
 import logging
-from typing import Optional
+from typing import Callable, Optional
+from urllib.parse import urlparse, urlunparse
+from cachetools import TTLCache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+# Concurrent generations Ollama serves; match the server's OLLAMA_NUM_PARALLEL
+OLLAMA_NUM_PARALLEL = int(os.getenv('OLLAMA_NUM_PARALLEL', '4'))
 
-class ClaimExtractor:
+# JSON schemas passed as Ollama's "format" so decoding is constrained to
+# valid JSON of the expected shape
+CLAIMS_SCHEMA = {
+    'type': 'object',
+    'properties': {
+        'claims': {'type': 'array', 'items': {'type': 'string'}}
+    },
+    'required': ['claims']
+}
+
+PACKED_CLAIMS_SCHEMA = {
+    'type': 'object',
+    'properties': {
+        'results': {
+            'type': 'array',
+            'items': {
+                'type': 'object',
+                'properties': {
+                    'id': {'type': 'integer'},
+                    'claims': {'type': 'array', 'items': {'type': 'string'}}
+                },
+                'required': ['id', 'claims']
+            }
+        }
+    },
+    'required': ['results']
+}
+
+
+class ExtractionResult(msgspec.Struct, omit_defaults=True):
+    """Result of extracting claims from one text, encoded directly to JSON"""
+    success: bool
+    claims: list
+    total_claims: int
+    processing_time: float
+    model_used: str = ''
+    error: Optional[str] = None
+
+
+class OllamaGenerateChunk(msgspec.Struct):
+    """The fields we read from an /api/generate reply (or one streamed line of it)"""
+    response: str = ''
+    done: bool = False
+    error: Optional[str] = None
+
+
+_GENERATE_DECODER = msgspec.json.Decoder(OllamaGenerateChunk)
+
+# Candidate starts of an embedded JSON value, and a decoder that parses
+# one complete value from a given offset
+_JSON_START_RE = re.compile(r'[{\[]')
+_JSON_DECODER = json.JSONDecoder()
+
+# Runs of sentence/line terminators, used to estimate how many claims a text holds
+_SENTENCE_END_RE = re.compile(r'[.!?\n]+')
+
+
+class JsonStreamScanner:
     """
-    Extract claims from text using Ollama LLM
+    Tracks bracket depth across streamed text to find where the first
+    top-level JSON value ends
     """
     
-    def __init__(self, 
-                 model: str = "llama3.2:3b",
-                 ollama_url: str = "http://localhost:11434"):
+    def __init__(self, objects_only: bool = False):
         """
-        Initialize the claim extractor
-        
         Args:
-            model: Ollama model to use (default: llama3.2)
-            ollama_url: Ollama API base URL
+            objects_only: Only a {...} object counts as the value, so
+                brackets in free-text preamble (e.g. "SOURCE [1]") are ignored
         """
-        self.model = model
-        self.ollama_url = ollama_url
-        self.api_endpoint = f"{ollama_url}/api/generate"
-        
-    def check_ollama_connection(self) -> bool:
-        """Check if Ollama is running and accessible"""
-        try:
-            response = requests.get(f"{self.ollama_url}/api/tags", timeout=5)
-            return response.status_code == 200
-        except requests.exceptions.RequestException:
-            return False
+        self.openers, self.closers = ('{', '}') if objects_only else ('{[', '}]')
+        self.depth = 0
+        self.started = False
+        self.in_string = False
+        self.escaped = False
     
-    def get_available_models(self) -> list:
-        """Get list of available models in Ollama"""
-        try:
-            response = requests.get(f"{self.ollama_url}/api/tags", timeout=5)
-            if response.status_code == 200:
-                data = response.json()
-                return [model['name'] for model in data.get('models', [])]
-            return []
-        except requests.exceptions.RequestException:
-            return []
-    
-    def create_extraction_prompt(self, text: str) -> str:
+    def feed(self, piece: str) -> int:
         """
-        Create the prompt for claim extraction
+        Scan the next piece of generated text
         
-        Args:
-            text: The text to extract claims from
-            
         Returns:
-            Formatted prompt for the LLM
+            Index just past the value's closing bracket in piece, or -1 if
+            the value has not closed yet
         """
-        prompt = f"""Extract all individual factual claims from the following text. 
+        for i, char in enumerate(piece):
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif char == '\\':
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"':
+                self.in_string = self.started
+            elif char in self.openers:
+                self.depth += 1
+                self.started = True
+            elif char in self.closers and self.started:
+                self.depth -= 1
+                if self.depth == 0:
+                    return i + 1
+        return -1
+
+
+def read_streamed_json(response) -> str:
+    """
+    Accumulate a streamed Ollama /api/generate response until the first
+    top-level JSON value in it is complete
+    
+    Args:
+        response: Streaming requests response (one JSON chunk per line)
+        
+    Returns:
+        The generated text, ending at the closing bracket of the JSON
+        value (or everything generated if it never closes)
+    """
+    parts = []
+    scanner = JsonStreamScanner()
+    
+    for line in response.iter_lines():
+        if not line:
+            continue
+        chunk = _GENERATE_DECODER.decode(line)
+        if chunk.error:
+            raise RuntimeError(f"Ollama error: {chunk.error}")
+        
+        piece = chunk.response
+        end = scanner.feed(piece)
+        if end >= 0:
+            parts.append(piece[:end])
+            return ''.join(parts)
+        parts.append(piece)
+        
+        if chunk.done:
+            break
+    
+    return ''.join(parts)
+
+
+# Prompt templates, filled in with str.format
+_EXTRACTION_PROMPT = """Extract all individual factual claims from the following text. 
 
 IMPORTANT RULES:
 1. Break down compound claims into separate atomic claims
@@ -83,8 +187,280 @@ Return ONLY a valid JSON object with this exact format:
 {{"claims": ["claim 1", "claim 2", "claim 3"]}}
 
 Extract all atomic claims now:"""
+
+_PACKED_EXTRACTION_PROMPT = """Extract all individual factual claims from each TEXT block below.
+
+IMPORTANT RULES:
+1. Break down compound claims into separate atomic claims
+2. Each claim should contain ONE verifiable fact only
+3. Keep the claims of each TEXT block separate
+
+{blocks}
+
+Return ONLY a valid JSON object with this exact format, one entry per TEXT block:
+{{"results": [{{"id": 1, "claims": ["claim 1", "claim 2"]}}, {{"id": 2, "claims": ["claim 1"]}}]}}
+
+Extract all atomic claims now:"""
+
+
+class ClaimExtractor:
+    """
+    Extract claims from text using Ollama LLM
+    """
+    
+    # Context window requested for packed prompts and the share of it
+    # reserved for the input texts (the rest is left for the output)
+    PACKED_NUM_CTX = 8192
+    PACKED_INPUT_RATIO = 0.5
+    
+    # Seconds to reuse the /api/tags response
+    TAGS_TTL = 30
+    
+    # Upper bound on generated tokens per text, and the stop sequence that
+    # ends generation once the model runs on past the JSON
+    MAX_NUM_PREDICT = 2048
+    STOP_SEQUENCES = ['\n\n\n']
+    
+    # Seconds allowed for one generate call: a single text, and a whole
+    # pack (however many texts it holds)
+    REQUEST_TIMEOUT = 120
+    MAX_PACKED_TIMEOUT = 240
+    
+    def __init__(self, 
+                 model: str = "llama3.2:3b",
+                 ollama_url: str = "http://localhost:11434"):
+        """
+        Initialize the claim extractor
+        
+        Args:
+            model: Ollama model to use (default: llama3.2)
+            ollama_url: Ollama API base URL
+        """
+        self.model = model
+        self.ollama_url = self.resolve_local_url(ollama_url)
+        self.api_endpoint = f"{self.ollama_url}/api/generate"
+        
+        # Pooled keep-alive connections to Ollama, shared by all calls
+        self.session = requests.Session()
+        self.session.headers['Connection'] = 'keep-alive'
+        self.session.mount('http://', HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(total=2, backoff_factor=0.1)
+        ))
+        
+        # /api/tags result as (fetched_at, model names). Once a generate
+        # call has succeeded the preflight is skipped until a call fails.
+        self._tags_cache = (0.0, None)
+        self._ollama_ready = False
+        
+        # Successful extractions keyed by a hash of the input text
+        self._cache = TTLCache(maxsize=1024, ttl=3600)
+        self._cache_lock = threading.Lock()
+        
+    @staticmethod
+    def resolve_local_url(url: str) -> str:
+        """
+        Replace a localhost URL's host with its IPv4 address, resolved once,
+        so requests skip name resolution and IPv6 fallback on every call
+        
+        Args:
+            url: Ollama API base URL
+            
+        Returns:
+            URL with the resolved host (unchanged for other hosts)
+        """
+        parsed = urlparse(url)
+        if parsed.hostname != 'localhost':
+            return url
+        try:
+            host_ip = socket.gethostbyname(parsed.hostname)
+        except OSError:
+            return url
+        netloc = f"{host_ip}:{parsed.port}" if parsed.port else host_ip
+        return urlunparse(parsed._replace(netloc=netloc))
+    
+    def fetch_models(self) -> Optional[list]:
+        """
+        Get the model names from /api/tags, cached for TAGS_TTL seconds
+        
+        Returns:
+            List of model names, or None if Ollama is unreachable
+        """
+        cached_at, models = self._tags_cache
+        if models is not None and time.time() - cached_at < self.TAGS_TTL:
+            return models
+        
+        try:
+            response = self.session.get(f"{self.ollama_url}/api/tags", timeout=5)
+            if response.status_code != 200:
+                return None
+            data = orjson.loads(response.content)
+            models = [model['name'] for model in data.get('models', [])]
+        except requests.exceptions.RequestException:
+            return None
+        
+        self._tags_cache = (time.time(), models)
+        return models
+    
+    def check_ollama_connection(self) -> bool:
+        """Check if Ollama is running and accessible"""
+        return self.fetch_models() is not None
+    
+    def get_available_models(self) -> list:
+        """Get list of available models in Ollama"""
+        return self.fetch_models() or []
+    
+    def mark_ollama_failed(self):
+        """Forget cached health so the next call re-checks Ollama"""
+        self._ollama_ready = False
+        self._tags_cache = (0.0, None)
+    
+    def cache_key(self, text: str, num_predict: Optional[int] = None) -> bytes:
+        """Hash of the text (and any explicit token limit) used as the extraction cache key"""
+        data = text if num_predict is None else f"{num_predict}\0{text}"
+        return hashlib.blake2b(data.encode('utf-8'), digest_size=16).digest()
+    
+    def estimate_num_predict(self, text: str) -> int:
+        """
+        Output token budget for a text, capped at MAX_NUM_PREDICT
+        
+        ~40 tokens per sentence or line (claim syntax and repeated
+        subjects) plus the text's own token count, since the claims
+        restate the text
+        """
+        sentences = max(1, len(_SENTENCE_END_RE.findall(text)))
+        return min(self.MAX_NUM_PREDICT, 96 + 40 * sentences + len(text) // 4)
+    
+    def estimate_packed_num_predict(self, texts: list, prompt: str) -> int:
+        """
+        Output token budget for a packed prompt: the per-text budgets
+        summed, clamped to the context left after the prompt itself
+        """
+        wanted = sum(self.estimate_num_predict(text) for text in texts)
+        return max(1, min(wanted, self.PACKED_NUM_CTX - self.estimate_tokens(prompt)))
+    
+    def get_cached(self, key: bytes) -> Optional[ExtractionResult]:
+        """Return a cached extraction result, or None on a miss"""
+        with self._cache_lock:
+            cached = self._cache.get(key)
+        if cached is None:
+            return None
+        return msgspec.structs.replace(cached, processing_time=0)
+    
+    def set_cached(self, key: bytes, result: ExtractionResult):
+        """Cache an extraction result if it succeeded"""
+        if result.success:
+            with self._cache_lock:
+                self._cache[key] = result
+    
+    def check_ollama_ready(self) -> Optional[str]:
+        """
+        Check that Ollama is running and the model is pulled
+        
+        Returns:
+            Error message, or None when ready
+        """
+        if self._ollama_ready:
+            return None
+        
+        if not self.check_ollama_connection():
+            return 'Ollama is not running. Please start Ollama with: ollama serve'
+        
+        available_models = self.get_available_models()
+        if not any(self.model in m for m in available_models):
+            return f'Model "{self.model}" not found. Available models: {available_models}. Pull it with: ollama pull {self.model}'
         
-        return prompt
+        return None
+    
+    def create_extraction_prompt(self, text: str) -> str:
+        """
+        Create the prompt for claim extraction
+        
+        Args:
+            text: The text to extract claims from
+            
+        Returns:
+            Formatted prompt for the LLM
+        """
+        return _EXTRACTION_PROMPT.format(text=text)
+    
+    def create_packed_prompt(self, texts: list) -> str:
+        """
+        Create a single prompt that extracts claims from several texts
+        
+        Args:
+            texts: The texts to extract claims from
+            
+        Returns:
+            Formatted prompt for the LLM
+        """
+        blocks = "\n".join(
+            f'TEXT {i}:\n"""\n{text}\n"""' for i, text in enumerate(texts, 1)
+        )
+        
+        return _PACKED_EXTRACTION_PROMPT.format(blocks=blocks)
+    
+    def estimate_tokens(self, text: str) -> int:
+        """Rough token count (~4 characters per token)"""
+        return len(text) // 4 + 1
+    
+    def pack_texts(self, texts: list, k: int = 4) -> list:
+        """
+        Group texts into packs that fit in one prompt
+        
+        Args:
+            texts: The texts to group
+            k: Maximum number of texts per pack
+            
+        Returns:
+            List of packs, each a list of (index, text) tuples
+        """
+        budget = int(self.PACKED_NUM_CTX * self.PACKED_INPUT_RATIO)
+        packs = []
+        current = []
+        used = 0
+        
+        for index, text in enumerate(texts):
+            tokens = self.estimate_tokens(text)
+            if current and (len(current) >= k or used + tokens > budget):
+                packs.append(current)
+                current = []
+                used = 0
+            current.append((index, text))
+            used += tokens
+        
+        if current:
+            packs.append(current)
+        
+        return packs
+    
+    def parse_packed_response(self, response_text: str, count: int) -> dict:
+        """
+        Split a packed LLM response back into per-text claim lists
+        
+        Args:
+            response_text: Raw response from LLM
+            count: Number of TEXT blocks in the prompt
+            
+        Returns:
+            Mapping of 1-based block id to its claims list
+        """
+        parsed = self.parse_llm_response(response_text)
+        results = parsed.get('results')
+        if not isinstance(results, list):
+            return {}
+        
+        claims_by_id = {}
+        for entry in results:
+            if not isinstance(entry, dict):
+                continue
+            block_id = entry.get('id')
+            claims = entry.get('claims')
+            if isinstance(block_id, int) and 1 <= block_id <= count and isinstance(claims, list):
+                claims_by_id[block_id] = [c for c in claims if isinstance(c, str)]
+        
+        return claims_by_id
     
     def parse_llm_response(self, response_text: str) -> dict:
         """
@@ -96,103 +472,97 @@ Extract all atomic claims now:"""
         Returns:
             Parsed claims dictionary
         """
+        # Responses are generated against a JSON schema (see CLAIMS_SCHEMA),
+        # so the whole body is the JSON object
         try:
-            # Try to parse as JSON directly
-            return json.loads(response_text)
-        except json.JSONDecodeError:
+            parsed = orjson.loads(response_text)
+            if isinstance(parsed, dict):
+                return parsed
+        except orjson.JSONDecodeError:
             pass
         
-        # Try to find JSON in the response
-        try:
-            # Look for JSON object pattern
-            start_idx = response_text.find('{')
-            end_idx = response_text.rfind('}') + 1
-            
-            if start_idx != -1 and end_idx > start_idx:
-                json_str = response_text[start_idx:end_idx]
-                return json.loads(json_str)
-        except json.JSONDecodeError:
-            pass
-        
-        # Try to find JSON array pattern
-        try:
-            start_idx = response_text.find('[')
-            end_idx = response_text.rfind(']') + 1
-            
-            if start_idx != -1 and end_idx > start_idx:
-                json_str = response_text[start_idx:end_idx]
-                claims_list = json.loads(json_str)
-                return {"claims": claims_list}
-        except json.JSONDecodeError:
-            pass
+        # Fallback for servers without structured outputs: decode the first
+        # complete JSON object or array embedded in the text
+        for match in _JSON_START_RE.finditer(response_text):
+            try:
+                parsed, _ = _JSON_DECODER.raw_decode(response_text, match.start())
+            except json.JSONDecodeError:
+                continue
+            if isinstance(parsed, dict):
+                return parsed
+            if isinstance(parsed, list):
+                return {"claims": parsed}
         
         logger.warning(f"Could not parse LLM response as JSON: {response_text[:200]}...")
         return {"claims": [], "parse_error": True, "raw_response": response_text}
     
-    def extract_claims(self, text: str) -> dict:
+    def extract_claims(self, text: str, num_predict: Optional[int] = None) -> ExtractionResult:
         """
         Extract claims from text using Ollama LLM
         
         Args:
             text: The text to analyze
+            num_predict: Max tokens to generate (default: estimated from
+                         the number of sentences)
             
         Returns:
-            Dictionary containing extracted claims and metadata
+            ExtractionResult with the claims and metadata
         """
         start_time = time.time()
         
-        # Check if Ollama is running
-        if not self.check_ollama_connection():
-            return {
-                'success': False,
-                'error': 'Ollama is not running. Please start Ollama with: ollama serve',
-                'claims': [],
-                'total_claims': 0,
-                'processing_time': 0
-            }
+        # Repeated texts are served from the cache
+        key = self.cache_key(text, num_predict)
+        cached = self.get_cached(key)
+        if cached is not None:
+            return cached
         
-        # Check if model is available
-        available_models = self.get_available_models()
-        if not any(self.model in m for m in available_models):
-            return {
-                'success': False,
-                'error': f'Model "{self.model}" not found. Available models: {available_models}. Pull it with: ollama pull {self.model}',
-                'claims': [],
-                'total_claims': 0,
-                'processing_time': 0
-            }
+        # Check that Ollama is running and has the model
+        error = self.check_ollama_ready()
+        if error:
+            return ExtractionResult(
+                success=False,
+                error=error,
+                claims=[],
+                total_claims=0,
+                processing_time=0
+            )
         
         # Create prompt
         prompt = self.create_extraction_prompt(text)
         
         try:
-            # Call Ollama API
-            response = requests.post(
+            # Call Ollama API, streaming so we can stop once the JSON is complete
+            with self.session.post(
                 self.api_endpoint,
                 json={
                     'model': self.model,
                     'prompt': prompt,
-                    'stream': False,
+                    'stream': True,
+                    'format': CLAIMS_SCHEMA,
                     'options': {
                         'temperature': 0.1,  # Low temperature for consistent output
-                        'num_predict': 2048,  # Max tokens to generate
+                        'num_predict': num_predict or self.estimate_num_predict(text),
+                        'stop': self.STOP_SEQUENCES,
                     }
                 },
-                timeout=120  # 2 minute timeout for longer texts
-            )
-            
-            if response.status_code != 200:
-                return {
-                    'success': False,
-                    'error': f'Ollama API error: {response.status_code}',
-                    'claims': [],
-                    'total_claims': 0,
-                    'processing_time': time.time() - start_time
-                }
-            
-            # Parse response
-            result = response.json()
-            llm_response = result.get('response', '')
+                timeout=self.REQUEST_TIMEOUT,
+                stream=True
+            ) as response:
+                if response.status_code != 200:
+                    self.mark_ollama_failed()
+                    return ExtractionResult(
+                        success=False,
+                        error=f'Ollama API error: {response.status_code}',
+                        claims=[],
+                        total_claims=0,
+                        processing_time=time.time() - start_time
+                    )
+                
+                self._ollama_ready = True
+                
+                # Leaving the block closes the connection, which makes Ollama
+                # stop generating if the JSON closed before num_predict
+                llm_response = read_streamed_json(response)
             
             # Extract claims from response
             parsed = self.parse_llm_response(llm_response)
@@ -200,39 +570,175 @@ Extract all atomic claims now:"""
             
             processing_time = time.time() - start_time
             
-            return {
-                'success': True,
-                'claims': claims,
-                'total_claims': len(claims),
-                'processing_time': round(processing_time, 2),
-                'model_used': self.model
-            }
+            result = ExtractionResult(
+                success=True,
+                claims=claims,
+                total_claims=len(claims),
+                processing_time=round(processing_time, 2),
+                model_used=self.model
+            )
+            # An unparseable (e.g. truncated) reply is returned but not cached
+            if not parsed.get('parse_error'):
+                self.set_cached(key, result)
+            return result
             
         except requests.exceptions.Timeout:
-            return {
-                'success': False,
-                'error': 'Request timed out. The text might be too long.',
-                'claims': [],
-                'total_claims': 0,
-                'processing_time': time.time() - start_time
-            }
+            self.mark_ollama_failed()
+            return ExtractionResult(
+                success=False,
+                error='Request timed out. The text might be too long.',
+                claims=[],
+                total_claims=0,
+                processing_time=time.time() - start_time
+            )
         except requests.exceptions.RequestException as e:
-            return {
-                'success': False,
-                'error': f'Request failed: {str(e)}',
-                'claims': [],
-                'total_claims': 0,
-                'processing_time': time.time() - start_time
-            }
+            self.mark_ollama_failed()
+            return ExtractionResult(
+                success=False,
+                error=f'Request failed: {str(e)}',
+                claims=[],
+                total_claims=0,
+                processing_time=time.time() - start_time
+            )
         except Exception as e:
             logger.error(f"Unexpected error in claim extraction: {str(e)}")
-            return {
-                'success': False,
-                'error': f'Unexpected error: {str(e)}',
-                'claims': [],
-                'total_claims': 0,
-                'processing_time': time.time() - start_time
-            }
+            return ExtractionResult(
+                success=False,
+                error=f'Unexpected error: {str(e)}',
+                claims=[],
+                total_claims=0,
+                processing_time=time.time() - start_time
+            )
+
+    
+    def extract_claims_packed(self,
+                              texts: list,
+                              k: int = 4,
+                              on_result: Optional[Callable[[int, ExtractionResult], None]] = None) -> list:
+        """
+        Extract claims from several texts, packing up to k texts per prompt
+        so Ollama handles each pack in a single generate call
+        
+        Args:
+            texts: The texts to analyze
+            k: Maximum number of texts per prompt (lowered automatically
+               when the texts would not fit in the context window)
+            on_result: Called with (index, result) as soon as each text's
+                       result is known, before the remaining packs run
+            
+        Returns:
+            One ExtractionResult per text, in input order
+        """
+        results = [None] * len(texts)
+        
+        def finish(index, result):
+            results[index] = result
+            if on_result is not None:
+                on_result(index, result)
+        
+        def fail(indexes, error, processing_time=0):
+            for index in indexes:
+                finish(index, ExtractionResult(
+                    success=False,
+                    error=error,
+                    claims=[],
+                    total_claims=0,
+                    processing_time=processing_time
+                ))
+        
+        error = self.check_ollama_ready()
+        if error:
+            fail(range(len(texts)), error)
+            return results
+        
+        keys = [self.cache_key(text) for text in texts]
+        
+        # Only texts without a cached result go to the LLM
+        pending = []
+        for index, text in enumerate(texts):
+            cached = self.get_cached(keys[index])
+            if cached is not None:
+                finish(index, cached)
+            else:
+                pending.append((index, text))
+        
+        for pack in self.pack_texts([text for _, text in pending], max(1, k)):
+            pack = [(pending[i][0], text) for i, text in pack]
+            
+            # A failed pack reset the health check; don't send the rest
+            # to an Ollama that is down
+            error = self.check_ollama_ready()
+            if error:
+                fail([index for index, _ in pack], error)
+                continue
+            
+            if len(pack) == 1:
+                index, text = pack[0]
+                finish(index, self.extract_claims(text))
+                continue
+            
+            start_time = time.time()
+            pack_inputs = [text for _, text in pack]
+            prompt = self.create_packed_prompt(pack_inputs)
+            
+            try:
+                response = self.session.post(
+                    self.api_endpoint,
+                    json={
+                        'model': self.model,
+                        'prompt': prompt,
+                        'stream': False,
+                        'format': PACKED_CLAIMS_SCHEMA,
+                        'options': {
+                            'temperature': 0.1,
+                            'num_predict': self.estimate_packed_num_predict(pack_inputs, prompt),
+                            'stop': self.STOP_SEQUENCES,
+                            'num_ctx': self.PACKED_NUM_CTX,
+                        }
+                    },
+                    timeout=min(self.REQUEST_TIMEOUT * len(pack), self.MAX_PACKED_TIMEOUT)
+                )
+                response.raise_for_status()
+                self._ollama_ready = True
+                claims_by_id = self.parse_packed_response(
+                    _GENERATE_DECODER.decode(response.content).response, len(pack)
+                )
+            except requests.exceptions.RequestException as e:
+                # Transport failure: retrying each text would just fail
+                # (or time out) again, once per text
+                self.mark_ollama_failed()
+                logger.warning(f"Packed extraction failed: {str(e)}")
+                fail([index for index, _ in pack], f'Request failed: {str(e)}',
+                     round(time.time() - start_time, 2))
+                continue
+            except msgspec.DecodeError as e:
+                logger.warning(f"Packed reply was malformed, falling back to single prompts: {str(e)}")
+                claims_by_id = {}
+            
+            processing_time = round(time.time() - start_time, 2)
+            
+            # Report the parsed blocks before re-running any missing ones
+            missing = []
+            for block_id, (index, text) in enumerate(pack, 1):
+                if block_id not in claims_by_id:
+                    missing.append((index, text))
+                    continue
+                claims = claims_by_id[block_id]
+                result = ExtractionResult(
+                    success=True,
+                    claims=claims,
+                    total_claims=len(claims),
+                    processing_time=processing_time,
+                    model_used=self.model
+                )
+                self.set_cached(keys[index], result)
+                finish(index, result)
+            
+            # Missing or malformed entries: extract those texts on their own
+            for index, text in missing:
+                finish(index, self.extract_claims(text))
+        
+        return results
 
 
 # Testing
@@ -262,4 +768,4 @@ if __name__ == '__main__':
     
     result = extractor.extract_claims(test_text)
     
-    print(json.dumps(result, indent=2))
+    print(msgspec.json.format(msgspec.json.encode(result), indent=2).decode())
@@ -11,13 +11,57 @@ import time
 import logging
 import re
 import os
-import requests
-from urllib.parse import quote_plus, urlparse
-from bs4 import BeautifulSoup
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import asyncio
+import contextlib
+import contextvars
+import functools
+import aiohttp
+import diskcache
+import msgspec
+import trafilatura
+from cachetools import TTLCache
+from html import unescape as unescape_html
+from urllib.parse import quote_plus, urlparse, parse_qs, unquote
+from selectolax.lexbor import LexborHTMLParser
+
+from background_loop import BackgroundLoop, SingleFlight, background_loop
+from claim_extractor import JsonStreamScanner, OllamaGenerateChunk, OLLAMA_NUM_PARALLEL
 
 logger = logging.getLogger(__name__)
 
+CACHE_DIR = os.getenv('VERIFIER_CACHE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.verifier_cache'))
+
+# aiohttp session shared by every request made inside an http_session() scope
+_session_var = contextvars.ContextVar('verifier_http_session', default=None)
+
+
+def new_http_session() -> aiohttp.ClientSession:
+    """Create a keep-alive pooled aiohttp session (call from inside the event loop)"""
+    connector = aiohttp.TCPConnector(limit=32, limit_per_host=4, ttl_dns_cache=300)
+    return aiohttp.ClientSession(connector=connector)
+
+
+def close_session_on(session: aiohttp.ClientSession, loop: asyncio.AbstractEventLoop):
+    """Close a session being replaced, on the loop that created it"""
+    if session is not None and not session.closed and loop.is_running():
+        asyncio.run_coroutine_threadsafe(session.close(), loop)
+
+
+@contextlib.asynccontextmanager
+async def http_session():
+    """Yield the enclosing scope's aiohttp session, or open one for this scope"""
+    session = _session_var.get()
+    if session is not None:
+        yield session
+        return
+    
+    async with new_http_session() as session:
+        token = _session_var.set(session)
+        try:
+            yield session
+        finally:
+            _session_var.reset(token)
+
 
 class WebScraper:
     """Scrapes web for evidence"""
@@ -28,51 +72,107 @@ class WebScraper:
         'Accept-Language': 'en-US,en;q=0.5',
     }
     
-    def search_duckduckgo(self, query: str, num_results: int = 8) -> list:
-        """Search DuckDuckGo and return URLs"""
+    CACHE_TTL = 24 * 60 * 60
+    MEMORY_CACHE_TTL = 10 * 60
+    
+    # Only this much is downloaded, this much HTML parsed and this much text kept per page
+    MAX_DOWNLOAD_BYTES = 512 * 1024
+    MAX_HTML_CHARS = 200_000
+    MAX_CONTENT_CHARS = 5000
+    # Below this, trafilatura has likely fallen back to gluing together the
+    # whole document's text (title and nav included)
+    MIN_EXTRACT_CHARS = 200
+    
+    WS_RE = re.compile(r'\s+')
+    TITLE_RE = re.compile(r'<title[^>]*>([^<]+)</title>', re.IGNORECASE)
+    
+    def __init__(self, cache_dir: str = CACHE_DIR):
+        # Successful searches and page scrapes persist across runs for CACHE_TTL
+        self.cache = diskcache.Cache(cache_dir, size_limit=2**30)
+        
+        # Recently used entries, so repeats don't touch SQLite at all
+        # (only ever accessed from the event loop thread)
+        self._memory = TTLCache(maxsize=1024, ttl=self.MEMORY_CACHE_TTL)
+        
+        # Claims that need the same search or page share one request
+        self._inflight = SingleFlight()
+    
+    async def fetch_cached(self, key: tuple, fetch, is_valid) -> object:
+        """
+        Return the cached value for key, or run fetch() once and cache it
+        
+        Args:
+            key: Cache key, e.g. ('page', url)
+            fetch: Zero-argument coroutine function producing the value
+            is_valid: Predicate deciding whether the value may be cached
+        """
+        cached = self._memory.get(key)
+        if cached is not None:
+            return cached
+        
+        return await self._inflight.run(key, lambda: self._fetch_and_store(key, fetch, is_valid))
+    
+    async def _fetch_and_store(self, key: tuple, fetch, is_valid) -> object:
+        # diskcache calls are blocking SQLite queries. to_thread moves them
+        # off the loop where threads are real; under gevent it doesn't, and
+        # the in-memory layer is what keeps repeats from reaching them
+        value = await asyncio.to_thread(self.cache.get, key)
+        if value is None:
+            value = await fetch()
+            if not is_valid(value):
+                return value
+            await asyncio.to_thread(self.cache.set, key, value, expire=self.CACHE_TTL)
+        
+        self._memory[key] = value
+        return value
+    
+    async def search_duckduckgo(self, query: str, num_results: int = 8) -> list:
+        """Search DuckDuckGo and return URLs (cached)"""
+        return await self.fetch_cached(
+            ('search', query, num_results),
+            lambda: self._search_duckduckgo(query, num_results),
+            bool
+        )
+    
+    async def _search_duckduckgo(self, query: str, num_results: int) -> list:
         try:
             url = f"https://html.duckduckgo.com/html/?q={quote_plus(query)}"
-            response = requests.get(url, headers=self.HEADERS, timeout=10)
-            soup = BeautifulSoup(response.text, 'html.parser')
+            async with http_session() as session:
+                async with session.get(url, headers=self.HEADERS, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                    html = await response.text()
+            tree = LexborHTMLParser(html)
             
             results = []
             
-            for result in soup.select('.result'):
-                url_elem = result.select_one('.result__url')
+            for result in tree.css('.result'):
+                url_elem = result.css_first('.result__url')
                 if url_elem:
-                    href = url_elem.get_text().strip()
+                    href = url_elem.text(strip=True)
                     if href:
                         if not href.startswith('http'):
                             href = 'https://' + href
                         results.append(href)
                         continue
                 
-                link = result.select_one('.result__a')
+                link = result.css_first('.result__a')
                 if link:
-                    href = link.get('href', '')
+                    href = link.attributes.get('href') or ''
                     if 'uddg=' in href:
-                        import urllib.parse
-                        parsed = urllib.parse.parse_qs(urllib.parse.urlparse(href).query)
+                        parsed = parse_qs(urlparse(href).query)
                         if 'uddg' in parsed:
-                            href = urllib.parse.unquote(parsed['uddg'][0])
+                            href = unquote(parsed['uddg'][0])
                     if href and href.startswith('http'):
                         results.append(href)
             
-            seen = set()
-            unique_results = []
-            for r in results:
-                if r not in seen:
-                    seen.add(r)
-                    unique_results.append(r)
-            
-            return unique_results[:num_results]
+            # dict.fromkeys drops duplicates while keeping result order
+            return list(dict.fromkeys(results))[:num_results]
         except Exception as e:
             logger.error(f"DuckDuckGo search error: {e}")
             return []
     
-    def search_with_fallback(self, query: str, num_results: int = 8) -> list:
+    async def search_with_fallback(self, query: str, num_results: int = 8) -> list:
         """Search with fallback to direct Wikipedia"""
-        results = self.search_duckduckgo(query, num_results)
+        results = await self.search_duckduckgo(query, num_results)
         
         if not results:
             wiki_query = query.replace(' ', '_')
@@ -83,34 +183,32 @@ class WebScraper:
         
         return results
     
-    def scrape_page(self, url: str) -> dict:
-        """Scrape content from a single page"""
+    async def scrape_page(self, url: str) -> dict:
+        """Scrape content from a single page (cached)"""
+        return await self.fetch_cached(
+            ('page', url),
+            lambda: self._scrape_page(url),
+            lambda result: result["success"]
+        )
+    
+    async def _scrape_page(self, url: str) -> dict:
         try:
-            response = requests.get(url, headers=self.HEADERS, timeout=8)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            for tag in soup(['script', 'style', 'nav', 'footer', 'header', 'aside', 'form', 'iframe']):
-                tag.decompose()
-            
-            title = soup.find('title')
-            title = title.get_text().strip() if title else ""
+            async with http_session() as session:
+                async with session.get(url, headers=self.HEADERS, timeout=aiohttp.ClientTimeout(total=8)) as response:
+                    response.raise_for_status()
+                    if 'html' not in response.content_type:
+                        logger.debug(f"Skipping non-HTML {response.content_type} at {url}")
+                        return {"url": url, "title": "", "content": "", "success": False}
+                    html = await self.read_capped(response)
             
-            content = ""
-            for selector in ['article', 'main', '.content', '#content', '.post', '.entry', '.mw-parser-output']:
-                elem = soup.select_one(selector)
-                if elem:
-                    content = elem.get_text(separator=' ', strip=True)
-                    break
+            # Extraction is CPU-bound. With real threads (e.g. the Flask dev
+            # server) to_thread lets the loop serve other requests meanwhile;
+            # under gunicorn's gevent workers threads are greenlets on one OS
+            # thread, so it still blocks the worker, bounded by MAX_HTML_CHARS
+            title, content = await asyncio.to_thread(self.extract_page, html[:self.MAX_HTML_CHARS])
             
-            if not content:
-                body = soup.find('body')
-                if body:
-                    content = body.get_text(separator=' ', strip=True)
-            
-            content = re.sub(r'\s+', ' ', content)
-            content = content[:5000]
+            # Truncate before collapsing whitespace so the regex sees at most 5KB
+            content = self.WS_RE.sub(' ', content[:self.MAX_CONTENT_CHARS])
             
             return {
                 "url": url,
@@ -122,21 +220,132 @@ class WebScraper:
             logger.debug(f"Scrape error for {url}: {e}")
             return {"url": url, "title": "", "content": "", "success": False}
     
-    def scrape_multiple(self, urls: list) -> list:
-        """Scrape multiple URLs in parallel"""
+    def extract_page(self, html: str) -> tuple:
+        """Pull (title, main text) out of a page's HTML"""
+        match = self.TITLE_RE.search(html)
+        title = unescape_html(match.group(1)).strip() if match else ""
+        
+        # trafilatura drops navigation and other boilerplate; fall back to
+        # probing content selectors when it finds nothing or next to nothing
+        content = trafilatura.extract(html, include_comments=False, include_tables=False, favor_precision=True)
+        if not content or len(content) < self.MIN_EXTRACT_CHARS:
+            content = self.extract_with_selectors(html) or content
+        
+        return title, content
+    
+    def extract_with_selectors(self, html: str) -> str:
+        """Text of the first matching content container, or of the whole body"""
+        tree = LexborHTMLParser(html)
+        
+        for tag in tree.css('script,style,nav,footer,header,aside,form,iframe'):
+            tag.decompose()
+        
+        for selector in ['article', 'main', '.content', '#content', '.post', '.entry', '.mw-parser-output']:
+            elem = tree.css_first(selector)
+            if elem:
+                content = elem.text(separator=' ', strip=True)
+                if content:
+                    return content
+                break
+        
+        body = tree.css_first('body')
+        return body.text(separator=' ', strip=True) if body else ""
+    
+    async def read_capped(self, response: aiohttp.ClientResponse) -> str:
+        """Read at most MAX_DOWNLOAD_BYTES of the body; the rest is never downloaded"""
+        chunks = []
+        size = 0
+        while size < self.MAX_DOWNLOAD_BYTES:
+            # read(n) may return fewer than n bytes, so keep going until the cap or EOF
+            chunk = await response.content.read(self.MAX_DOWNLOAD_BYTES - size)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            size += len(chunk)
+        return b''.join(chunks).decode(response.charset or 'utf-8', errors='replace')
+    
+    async def scrape_multiple(self, urls: list) -> list:
+        """Scrape multiple URLs concurrently (at most 5 at a time)"""
+        semaphore = asyncio.Semaphore(5)
+        
+        async def scrape_bounded(url):
+            async with semaphore:
+                return await self.scrape_page(url)
+        
+        async with http_session():
+            pages = await asyncio.gather(*[scrape_bounded(url) for url in urls], return_exceptions=True)
+        
         results = []
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = {executor.submit(self.scrape_page, url): url for url in urls}
-            for future in as_completed(futures, timeout=30):
-                try:
-                    result = future.result()
-                    if result["success"] and result["content"]:
-                        results.append(result)
-                except Exception as e:
-                    logger.debug(f"Scrape thread error: {e}")
+        for result in pages:
+            if isinstance(result, Exception):
+                logger.debug(f"Scrape task error: {result}")
+            elif result["success"] and result["content"]:
+                results.append(result)
         return results
 
 
+# Host of an http(s) URL, skipping any user:password@ and a leading www.
+_DOMAIN_RE = re.compile(r'^https?://(?:[^/?#@]*@)?(?:www\.)?([^/:?#]+)', re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=4096)
+def _get_domain(url: str) -> str:
+    match = _DOMAIN_RE.match(url)
+    return match.group(1).lower() if match else ""
+
+
+_GENERATE_DECODER = msgspec.json.Decoder(OllamaGenerateChunk)
+
+
+async def read_streamed_json_async(response: aiohttp.ClientResponse) -> str:
+    """
+    Async counterpart of claim_extractor.read_streamed_json: accumulate a
+    streamed Ollama reply until its first top-level JSON object closes
+    (the verdict prompt isn't schema-constrained, so arrays don't count)
+    """
+    parts = []
+    scanner = JsonStreamScanner(objects_only=True)
+    
+    async for line in response.content:
+        if not line.strip():
+            continue
+        chunk = _GENERATE_DECODER.decode(line)
+        if chunk.error:
+            raise RuntimeError(f"Ollama error: {chunk.error}")
+        
+        piece = chunk.response
+        end = scanner.feed(piece)
+        if end >= 0:
+            parts.append(piece[:end])
+            return ''.join(parts)
+        parts.append(piece)
+        
+        if chunk.done:
+            break
+    
+    return ''.join(parts)
+
+
+def build_domain_trie(tiers: list) -> dict:
+    """
+    Build a trie keyed by reversed domain labels (com -> cnn -> ...)
+    
+    Args:
+        tiers: (domains, score, tier name) tuples
+    
+    Returns:
+        Nested dicts; the None key of a node holds its {"score", "tier"} match
+    """
+    trie = {}
+    for domains, score, tier in tiers:
+        for site in domains:
+            node = trie
+            for label in reversed(site.split('.')):
+                node = node.setdefault(label, {})
+            node[None] = {"score": score, "tier": tier}
+    return trie
+
+
 class SourceScorer:
     """Scores sources by credibility"""
     
@@ -170,35 +379,32 @@ class SourceScorer:
         'webmd.com', 'medicalnewstoday.com',
     }
     
+    # 'gov' and 'edu' sit at the root, so they match every .gov/.edu domain
+    DOMAIN_TRIE = build_domain_trie([
+        (TIER_1, 100, "Highly Authoritative"),
+        (TIER_2, 85, "Very Reliable"),
+        (TIER_3, 70, "Reliable"),
+        (TIER_4, 50, "Moderate"),
+    ])
+    
+    UNVERIFIED = {"score": 30, "tier": "Unverified Source"}
+    
     def get_domain(self, url: str) -> str:
-        try:
-            parsed = urlparse(url)
-            domain = parsed.netloc.lower()
-            domain = domain.replace('www.', '')
-            return domain
-        except:
-            return ""
+        return _get_domain(url)
     
     def score_source(self, url: str) -> dict:
         domain = self.get_domain(url)
         
-        for site in self.TIER_1:
-            if site in domain or domain.endswith('.gov') or domain.endswith('.edu'):
-                return {"domain": domain, "score": 100, "tier": "Highly Authoritative"}
+        # Walk the trie from the TLD down, keeping the deepest (most specific) match
+        match = self.UNVERIFIED
+        node = self.DOMAIN_TRIE
+        for label in reversed(domain.split('.')):
+            node = node.get(label)
+            if node is None:
+                break
+            match = node.get(None, match)
         
-        for site in self.TIER_2:
-            if site in domain:
-                return {"domain": domain, "score": 85, "tier": "Very Reliable"}
-        
-        for site in self.TIER_3:
-            if site in domain:
-                return {"domain": domain, "score": 70, "tier": "Reliable"}
-        
-        for site in self.TIER_4:
-            if site in domain:
-                return {"domain": domain, "score": 50, "tier": "Moderate"}
-        
-        return {"domain": domain, "score": 30, "tier": "Unverified Source"}
+        return {"domain": domain, **match}
 
 
 class ClaimVerifier:
@@ -215,50 +421,99 @@ class ClaimVerifier:
         'experts say', 'studies show', 'research suggests', 'reportedly',
     ]
     
-    def __init__(self):
+    AMBIGUOUS_RE = re.compile(r'\b(' + '|'.join(re.escape(w) for w in AMBIGUOUS_WORDS) + r')\b')
+    
+    WORD_RE = re.compile(r"[a-z0-9']+")
+    
+    def __init__(self, runner: BackgroundLoop = background_loop):
         self.ollama_model = "llama3.2:3b"
         self.ollama_url = "http://localhost:11434/api/generate"
         self.scraper = WebScraper()
         self.scorer = SourceScorer()
+        
+        # Caps in-flight Ollama requests; further claims wait here rather
+        # than queueing (and timing out) inside the server
+        self._ollama_slots = asyncio.Semaphore(OLLAMA_NUM_PARALLEL)
+        
+        # verify() runs on the shared background loop; the HTTP session made
+        # there is kept across calls so pooled connections to Ollama and
+        # scraped sites stay warm
+        self.runner = runner
+        self._session = None
+        self._session_loop = None
+        
+        # Ollama gets its own pool: the shared scraping connector allows only
+        # 4 connections per host, fewer than OLLAMA_NUM_PARALLEL may be
+        self._ollama_session = None
+        self._ollama_session_loop = None
+    
+    def verify(self, claims: list) -> dict:
+        """Verify claims from synchronous code on the shared background loop"""
+        return self.runner.run(self._verify_in_session(claims))
     
-    def query_ollama(self, prompt: str) -> str:
-        """Query local Ollama LLM"""
+    async def _verify_in_session(self, claims: list) -> dict:
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            close_session_on(self._session, self._session_loop)
+            self._session = new_http_session()
+            self._session_loop = loop
+        _session_var.set(self._session)
+        return await self.verify_all_claims(claims)
+    
+    def ollama_session(self) -> aiohttp.ClientSession:
+        """Keep-alive session for Ollama calls, bound to the running loop"""
+        loop = asyncio.get_running_loop()
+        if (self._ollama_session is None or self._ollama_session.closed
+                or self._ollama_session_loop is not loop):
+            close_session_on(self._ollama_session, self._ollama_session_loop)
+            connector = aiohttp.TCPConnector(limit_per_host=OLLAMA_NUM_PARALLEL)
+            self._ollama_session = aiohttp.ClientSession(connector=connector)
+            self._ollama_session_loop = loop
+        return self._ollama_session
+    
+    async def query_ollama(self, prompt: str) -> str:
+        """Query local Ollama LLM, stopping once the verdict JSON is complete"""
         try:
-            response = requests.post(
-                self.ollama_url,
-                json={
-                    "model": self.ollama_model,
-                    "prompt": prompt,
-                    "stream": False,
-                    "options": {
-                        "temperature": 0.1,
-                        "num_predict": 600
-                    }
-                },
-                timeout=90
-            )
-            response.raise_for_status()
-            return response.json().get('response', '')
+            async with self._ollama_slots:
+                async with self.ollama_session().post(
+                    self.ollama_url,
+                    json={
+                        "model": self.ollama_model,
+                        "prompt": prompt,
+                        "stream": True,
+                        "keep_alive": "10m",
+                        "options": {
+                            "temperature": 0.1,
+                            "num_predict": 600
+                        }
+                    },
+                    timeout=aiohttp.ClientTimeout(total=90)
+                ) as response:
+                    response.raise_for_status()
+                    # Leaving the response early closes the stream, which
+                    # makes Ollama stop generating
+                    return await read_streamed_json_async(response)
         except Exception as e:
             logger.error(f"Ollama error: {e}")
             return ""
     
     def is_ambiguous(self, claim: str) -> tuple:
         """Check for ambiguous words"""
-        claim_lower = claim.lower()
-        matched = []
-        for word in self.AMBIGUOUS_WORDS:
-            if re.search(r'\b' + re.escape(word) + r'\b', claim_lower):
-                matched.append(word)
+        # One pass over the claim; dict.fromkeys drops repeats, keeping order
+        matched = list(dict.fromkeys(self.AMBIGUOUS_RE.findall(claim.lower())))
         return (len(matched) > 0, matched)
     
-    def analyze_evidence(self, claim: str, evidence: list) -> dict:
+    async def analyze_evidence(self, claim: str, evidence: list) -> dict:
         """Use Ollama to analyze scraped evidence against claim"""
         
-        evidence_text = ""
+        parts = []
         for i, e in enumerate(evidence[:4], 1):
-            evidence_text += f"\n\nSOURCE {i} ({e['source_info']['domain']}):\n"
-            evidence_text += f"Content: {e['content'][:1000]}\n"
+            # Sliced once per page and kept on the evidence entry
+            excerpt = e.get('excerpt')
+            if excerpt is None:
+                excerpt = e['excerpt'] = e['content'][:1000]
+            parts.append(f"\n\nSOURCE {i} ({e['source_info']['domain']}):\nContent: {excerpt}\n")
+        evidence_text = ''.join(parts)
         
         prompt = f"""You are a fact-checker. Compare the claim with the web evidence and determine if it's true or false.
 
@@ -272,7 +527,7 @@ Based on the evidence, respond with ONLY a JSON object:
 JSON response:"""
 
         try:
-            text = self.query_ollama(prompt)
+            text = await self.query_ollama(prompt)
             
             if not text:
                 return self._analyze_without_llm(claim, evidence)
@@ -289,12 +544,15 @@ JSON response:"""
     
     def _analyze_without_llm(self, claim: str, evidence: list) -> dict:
         """Keyword matching fallback when LLM fails"""
-        claim_words = set(w.lower() for w in claim.split() if len(w) > 3)
+        claim_words = {w for w in self.WORD_RE.findall(claim.lower()) if len(w) > 3}
         
         support_count = 0
         for e in evidence[:5]:
-            content_lower = e['content'].lower()
-            matches = sum(1 for word in claim_words if word in content_lower)
+            # Tokenized once per page and kept on the evidence entry
+            content_words = e.get('content_words')
+            if content_words is None:
+                content_words = e['content_words'] = set(self.WORD_RE.findall(e['content'].lower()))
+            matches = len(claim_words & content_words)
             if matches > len(claim_words) * 0.4:
                 support_count += 1
         
@@ -305,7 +563,7 @@ JSON response:"""
         else:
             return {"verdict": "CONTRADICTED", "confidence": 50, "correction": "Unable to verify - check sources", "key_facts": []}
     
-    def verify_single_claim(self, claim: str) -> dict:
+    async def verify_single_claim(self, claim: str) -> dict:
         """Verify a single claim using web evidence"""
         start_time = time.time()
         
@@ -326,7 +584,7 @@ JSON response:"""
         
         # Search the web
         search_query = claim
-        urls = self.scraper.search_with_fallback(search_query, num_results=6)
+        urls = await self.scraper.search_with_fallback(search_query, num_results=6)
         
         if not urls:
             return {
@@ -341,7 +599,7 @@ JSON response:"""
             }
         
         # Scrape pages
-        scraped = self.scraper.scrape_multiple(urls)
+        scraped = await self.scraper.scrape_multiple(urls)
         
         if not scraped:
             return {
@@ -367,7 +625,7 @@ JSON response:"""
         avg_source_score = sum(e["source_info"]["score"] for e in evidence) / len(evidence) if evidence else 0
         
         # Analyze with Ollama
-        analysis = self.analyze_evidence(claim, evidence)
+        analysis = await self.analyze_evidence(claim, evidence)
         
         # Map verdict to status
         verdict_map = {
@@ -405,10 +663,9 @@ JSON response:"""
             "processing_time": round(time.time() - start_time, 2)
         }
     
-    def verify_all_claims(self, claims: list) -> dict:
-        """Verify all claims"""
+    async def verify_all_claims(self, claims: list) -> dict:
+        """Verify all claims concurrently over one shared HTTP session"""
         start_time = time.time()
-        results = []
         
         summary = {
             "verified": 0,
@@ -420,10 +677,11 @@ JSON response:"""
         
         total_sources = 0
         
-        for i, claim in enumerate(claims):
-            print(f"  Verifying claim {i+1}/{len(claims)}...")
-            result = self.verify_single_claim(claim)
-            results.append(result)
+        print(f"  Verifying {len(claims)} claims...")
+        async with http_session():
+            results = await asyncio.gather(*[self.verify_single_claim(claim) for claim in claims])
+        
+        for result in results:
             status = result["status"]
             if status in summary:
                 summary[status] += 1
@@ -463,7 +721,7 @@ if __name__ == '__main__':
     
     for claim in test_claims:
         print(f"\n📋 Claim: {claim}")
-        result = verifier.verify_single_claim(claim)
+        result = verifier.runner.run(verifier.verify_single_claim(claim))
         print(f"   Status: {result['status'].upper()}")
         print(f"   Confidence: {result['confidence_score']}%")
         if result.get('correction'):
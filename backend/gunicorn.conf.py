@@ -0,0 +1,30 @@
+"""
+Gunicorn configuration for the Hallucination Detector backend
+Run from the backend directory with: gunicorn -c gunicorn.conf.py app:app
+"""
+
+# Patch blocking I/O before the app (and requests) is imported so each
+# worker can hold many Ollama calls in flight
+from gevent import monkey
+monkey.patch_all()
+
+import multiprocessing
+import os
+
+bind = os.getenv('BIND', '0.0.0.0:5000')
+
+# gevent workers: one process serves many concurrent, I/O-bound requests
+worker_class = 'gevent'
+workers = int(os.getenv('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+worker_connections = 1000
+
+# Ollama calls can take up to 2 minutes; leave headroom
+timeout = 180
+graceful_timeout = 30
+keepalive = 5
+
+
+def post_worker_init(worker):
+    """Build the claim verifier up front so the first /api/verify doesn't pay for it"""
+    from app import get_claim_verifier
+    get_claim_verifier()
@@ -0,0 +1,97 @@
+"""
+Tests for BackgroundLoop and SingleFlight
+"""
+
+import asyncio
+import threading
+import unittest
+
+from background_loop import BackgroundLoop, SingleFlight
+
+
+class BackgroundLoopTest(unittest.TestCase):
+
+    def test_run_returns_result_from_any_thread(self):
+        runner = BackgroundLoop('test-loop')
+
+        async def double(x):
+            await asyncio.sleep(0)
+            return x * 2
+
+        results = []
+        threads = [threading.Thread(target=lambda i=i: results.append(runner.run(double(i)))) for i in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sorted(results), [0, 2, 4, 6, 8])
+
+    def test_run_reraises(self):
+        runner = BackgroundLoop('test-loop')
+
+        async def fail():
+            raise ValueError('boom')
+
+        with self.assertRaises(ValueError):
+            runner.run(fail())
+
+    def test_loop_is_reused(self):
+        runner = BackgroundLoop('test-loop')
+        self.assertIs(runner.loop, runner.loop)
+
+
+class SingleFlightTest(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.flight = SingleFlight()
+        self.calls = 0
+
+    async def slow(self, value, delay=0.01):
+        self.calls += 1
+        await asyncio.sleep(delay)
+        return value
+
+    async def test_identical_calls_share_one_task(self):
+        results = await asyncio.gather(*[self.flight.run('k', lambda: self.slow('v')) for _ in range(5)])
+        self.assertEqual(results, ['v'] * 5)
+        self.assertEqual(self.calls, 1)
+
+    async def test_different_keys_run_separately(self):
+        results = await asyncio.gather(
+            self.flight.run('a', lambda: self.slow(1)),
+            self.flight.run('b', lambda: self.slow(2)),
+        )
+        self.assertEqual(results, [1, 2])
+        self.assertEqual(self.calls, 2)
+
+    async def test_finished_key_runs_again(self):
+        await self.flight.run('k', lambda: self.slow(1))
+        await self.flight.run('k', lambda: self.slow(2))
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(self.flight._inflight, {})
+
+    async def test_exception_reaches_every_caller(self):
+        async def fail():
+            self.calls += 1
+            await asyncio.sleep(0.01)
+            raise ValueError('boom')
+
+        results = await asyncio.gather(*[self.flight.run('k', fail) for _ in range(3)], return_exceptions=True)
+        self.assertEqual(self.calls, 1)
+        self.assertTrue(all(isinstance(r, ValueError) for r in results))
+        self.assertEqual(self.flight._inflight, {})
+
+    async def test_cancelled_caller_does_not_cancel_the_others(self):
+        first = asyncio.ensure_future(self.flight.run('k', lambda: self.slow('v', 0.05)))
+        second = asyncio.ensure_future(self.flight.run('k', lambda: self.slow('other')))
+        await asyncio.sleep(0.01)
+        first.cancel()
+
+        self.assertEqual(await second, 'v')
+        self.assertTrue(first.cancelled())
+        self.assertEqual(self.calls, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
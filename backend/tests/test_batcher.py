@@ -0,0 +1,159 @@
+"""
+Tests for ClaimBatcher, run against a stub extractor
+"""
+
+import asyncio
+import threading
+import time
+import unittest
+
+from background_loop import BackgroundLoop
+from batcher import ClaimBatcher
+from claim_extractor import ExtractionResult
+
+
+def result_for(text):
+    return ExtractionResult(success=True, claims=[text], total_claims=1, processing_time=0)
+
+
+class StubExtractor:
+    """Records calls; packed batches can stall after their first result"""
+
+    def __init__(self, stall_after_first=0.0, fail=False):
+        self.stall_after_first = stall_after_first
+        self.fail = fail
+        self.single_calls = []
+        self.packed_calls = []
+
+    def cache_key(self, text):
+        return text
+
+    def extract_claims(self, text):
+        if self.fail:
+            raise RuntimeError('extraction failed')
+        self.single_calls.append(text)
+        return result_for(text)
+
+    def extract_claims_packed(self, texts, k=4, on_result=None):
+        if self.fail:
+            raise RuntimeError('extraction failed')
+        self.packed_calls.append(list(texts))
+        results = []
+        for index, text in enumerate(texts):
+            if index == 1:
+                time.sleep(self.stall_after_first)
+            results.append(result_for(text))
+            on_result(index, results[-1])
+        return results
+
+
+async def cancel_other_tasks():
+    current = asyncio.current_task()
+    tasks = [task for task in asyncio.all_tasks() if task is not current]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class ClaimBatcherTest(unittest.TestCase):
+
+    def setUp(self):
+        self.runner = BackgroundLoop('test-batcher')
+
+    def tearDown(self):
+        # Stop the batch collector so it doesn't outlive the test
+        self.runner.run(cancel_other_tasks())
+        loop = self.runner.loop
+        loop.call_soon_threadsafe(loop.stop)
+        while loop.is_running():
+            time.sleep(0.001)
+        loop.close()
+
+    def make_batcher(self, extractor, max_batch=8, timeout_ms=100):
+        return ClaimBatcher(extractor, max_batch=max_batch, timeout_ms=timeout_ms, runner=self.runner)
+
+    def submit_all(self, batcher, texts, stagger=0.0):
+        """Submit each text from its own thread; return {text: (result, seconds taken)}"""
+        results = {}
+        start = time.monotonic()
+
+        def submit(text):
+            result = batcher.submit(text)
+            results.setdefault(text, []).append((result, time.monotonic() - start))
+
+        threads = []
+        for text in texts:
+            threads.append(threading.Thread(target=submit, args=(text,)))
+            threads[-1].start()
+            time.sleep(stagger)
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_lone_text_uses_single_extraction(self):
+        extractor = StubExtractor()
+        result = self.make_batcher(extractor).submit('only')
+
+        self.assertEqual(result.claims, ['only'])
+        self.assertEqual(extractor.single_calls, ['only'])
+        self.assertEqual(extractor.packed_calls, [])
+
+    def test_concurrent_texts_share_one_packed_call(self):
+        extractor = StubExtractor()
+        texts = [f'text {i}' for i in range(4)]
+        results = self.submit_all(self.make_batcher(extractor), texts)
+
+        self.assertEqual(len(extractor.packed_calls), 1)
+        self.assertCountEqual(extractor.packed_calls[0], texts)
+        for text in texts:
+            self.assertEqual(results[text][0][0].claims, [text])
+
+    def test_batches_are_capped_at_max_batch(self):
+        extractor = StubExtractor()
+        texts = [f'text {i}' for i in range(5)]
+        results = self.submit_all(self.make_batcher(extractor, max_batch=2), texts)
+
+        batched = extractor.single_calls + [t for call in extractor.packed_calls for t in call]
+        self.assertCountEqual(batched, texts)
+        self.assertTrue(all(len(call) <= 2 for call in extractor.packed_calls))
+        self.assertEqual(len(results), 5)
+
+    def test_identical_texts_are_extracted_once(self):
+        extractor = StubExtractor()
+        results = self.submit_all(self.make_batcher(extractor), ['same'] * 3 + ['other'])
+
+        self.assertEqual(extractor.packed_calls, [['same', 'other']])
+        self.assertEqual([r.claims for r, _ in results['same']], [['same']] * 3)
+
+    def test_callers_return_as_their_own_text_finishes(self):
+        extractor = StubExtractor(stall_after_first=0.5)
+        # Stagger submits so the first text is first in the batch
+        results = self.submit_all(self.make_batcher(extractor), ['first', 'second'], stagger=0.02)
+
+        first_done = results['first'][0][1]
+        second_done = results['second'][0][1]
+        self.assertLess(first_done, 0.4)
+        self.assertGreaterEqual(second_done, 0.5)
+
+    def test_failure_reaches_every_caller(self):
+        batcher = self.make_batcher(StubExtractor(fail=True))
+        errors = []
+
+        def submit(text):
+            try:
+                batcher.submit(text)
+            except RuntimeError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=submit, args=(f'text {i}',)) for i in range(3)]
+        with self.assertLogs('batcher', level='ERROR'):
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(len(errors), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
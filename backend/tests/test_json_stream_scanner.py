@@ -0,0 +1,69 @@
+"""
+Tests for JsonStreamScanner (early stop of streamed Ollama replies)
+"""
+
+import unittest
+
+from claim_extractor import JsonStreamScanner
+
+
+def scan(pieces, **kwargs):
+    """Feed pieces in order; return the text up to where the value closed"""
+    scanner = JsonStreamScanner(**kwargs)
+    parts = []
+    for piece in pieces:
+        end = scanner.feed(piece)
+        if end >= 0:
+            parts.append(piece[:end])
+            return ''.join(parts)
+        parts.append(piece)
+    return None
+
+
+class JsonStreamScannerTest(unittest.TestCase):
+
+    def test_object_in_one_piece(self):
+        self.assertEqual(scan(['{"claims": ["a"]} trailing']), '{"claims": ["a"]}')
+
+    def test_object_split_across_pieces(self):
+        text = '{"claims": ["one", "two"]}\n\n more'
+        pieces = [text[i:i + 3] for i in range(0, len(text), 3)]
+        self.assertEqual(scan(pieces), '{"claims": ["one", "two"]}')
+
+    def test_top_level_array(self):
+        self.assertEqual(scan(['["a", ', '"b"] and more']), '["a", "b"]')
+
+    def test_brackets_inside_strings_are_ignored(self):
+        self.assertEqual(scan(['{"claims": ["a } ] [ {"]}x']), '{"claims": ["a } ] [ {"]}')
+
+    def test_escaped_quote_inside_string(self):
+        self.assertEqual(scan(['{"c": "say \\"}\\" now"}', 'x']), '{"c": "say \\"}\\" now"}')
+
+    def test_escape_split_across_pieces(self):
+        self.assertEqual(scan(['{"c": "a\\', '"}', '"}tail']), '{"c": "a\\"}"}')
+
+    def test_unclosed_value(self):
+        self.assertIsNone(scan(['{"claims": ["a"', ', "b"']))
+
+    def test_preamble_before_object(self):
+        self.assertEqual(scan(['Here you go: {"a": 1}']), 'Here you go: {"a": 1}')
+
+    def test_quote_in_preamble_does_not_start_a_string(self):
+        self.assertEqual(scan(['The "answer": {"a": "}"}']), 'The "answer": {"a": "}"}')
+
+    def test_preamble_brackets_end_the_value_by_default(self):
+        self.assertEqual(scan(['Based on SOURCE [1], {"a": 1}']), 'Based on SOURCE [1]')
+
+    def test_objects_only_skips_preamble_brackets(self):
+        pieces = ['Based on SOURCE [1], ', 'here is the JSON:\n', '{"verdict": "SUPPORTED", "key_facts": ["[2]"]}', ' then {more}']
+        self.assertEqual(
+            scan(pieces, objects_only=True),
+            'Based on SOURCE [1], here is the JSON:\n{"verdict": "SUPPORTED", "key_facts": ["[2]"]}'
+        )
+
+    def test_objects_only_ignores_a_bare_array(self):
+        self.assertIsNone(scan(['["a", "b"]'], objects_only=True))
+
+
+if __name__ == '__main__':
+    unittest.main()
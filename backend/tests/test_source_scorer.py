@@ -0,0 +1,76 @@
+"""
+Tests for domain extraction and the source-scoring trie
+"""
+
+import unittest
+
+from claim_verifier import SourceScorer, _get_domain, build_domain_trie
+
+
+class GetDomainTest(unittest.TestCase):
+
+    def test_strips_scheme_www_port_and_path(self):
+        self.assertEqual(_get_domain('https://www.BBC.co.uk:443/news?a=1'), 'bbc.co.uk')
+
+    def test_skips_userinfo(self):
+        self.assertEqual(_get_domain('https://user@cnn.com/x'), 'cnn.com')
+        self.assertEqual(_get_domain('https://u:p@www.cnn.com/x'), 'cnn.com')
+
+    def test_at_sign_after_the_host_is_not_userinfo(self):
+        self.assertEqual(_get_domain('http://x.org/path@foo'), 'x.org')
+        self.assertEqual(_get_domain('https://x.org?q=a@b'), 'x.org')
+
+    def test_non_http_url(self):
+        self.assertEqual(_get_domain('ftp://example.com/file'), '')
+
+
+class BuildDomainTrieTest(unittest.TestCase):
+
+    def test_labels_are_stored_in_reverse(self):
+        trie = build_domain_trie([({'cnn.com'}, 70, 'Reliable')])
+        self.assertEqual(trie, {'com': {'cnn': {None: {'score': 70, 'tier': 'Reliable'}}}})
+
+    def test_shared_suffixes_share_nodes(self):
+        trie = build_domain_trie([
+            ({'gov'}, 100, 'Top'),
+            ({'nasa.gov'}, 85, 'Next'),
+        ])
+        self.assertEqual(trie['gov'][None]['score'], 100)
+        self.assertEqual(trie['gov']['nasa'][None]['score'], 85)
+
+    def test_later_tiers_override_duplicates(self):
+        trie = build_domain_trie([({'a.com'}, 100, 'Top'), ({'a.com'}, 50, 'Low')])
+        self.assertEqual(trie['com']['a'][None]['score'], 50)
+
+
+class SourceScorerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.scorer = SourceScorer()
+
+    def score(self, url):
+        return self.scorer.score_source(url)['score']
+
+    def test_exact_domain(self):
+        self.assertEqual(self.score('https://cnn.com/story'), 70)
+
+    def test_subdomain_matches_its_parent(self):
+        self.assertEqual(self.score('https://edition.cnn.com/story'), 70)
+
+    def test_most_specific_match_wins(self):
+        # nasa.gov is tier 2, below the catch-all 'gov' entry in tier 1
+        self.assertEqual(self.score('https://www.nasa.gov/mission'), 85)
+        self.assertEqual(self.score('https://data.census.gov/table'), 100)
+
+    def test_lookalike_domain_is_unverified(self):
+        self.assertEqual(self.score('https://notcnn.com/story'), 30)
+        self.assertEqual(self.score('https://cnn.com.evil.net/story'), 30)
+
+    def test_unknown_and_empty_domains(self):
+        self.assertEqual(self.score('https://example.org'), 30)
+        self.assertEqual(self.scorer.score_source('not a url'),
+                         {'domain': '', 'score': 30, 'tier': 'Unverified Source'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,9 +3,14 @@ Text Cleaner Module
 Handles text preprocessing and cleaning for LLM input
 """
 
+import multiprocessing
+import os
 import re
+import sys
+import threading
 import unicodedata
-from typing import Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Optional
 
 
 class TextCleaner:
@@ -13,19 +18,82 @@ class TextCleaner:
     Text cleaning utility for preparing text for LLM processing
     """
     
-    def __init__(self):
-        # Common contractions mapping
-        self.contractions = {
-            "won't": "will not",
-            "can't": "cannot",
-            "n't": " not",
-            "'re": " are",
-            "'s": " is",
-            "'d": " would",
-            "'ll": " will",
-            "'ve": " have",
-            "'m": " am"
-        }
+    # Common contractions mapping
+    contractions = {
+        "won't": "will not",
+        "can't": "cannot",
+        "n't": " not",
+        "'re": " are",
+        "'s": " is",
+        "'d": " would",
+        "'ll": " will",
+        "'ve": " have",
+        "'m": " am"
+    }
+    _CONTRACTION_RES = [
+        (re.compile(re.escape(contraction), re.IGNORECASE), expansion)
+        for contraction, expansion in contractions.items()
+    ]
+    
+    # Patterns are compiled once at class creation and shared by all instances
+    _URL_RE = re.compile(r'https?://\S+|www\.\S+|ftp://\S+')
+    _EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+    _HTML_TAG_RE = re.compile(r'<[^>]+>')
+    _WS_TABS_RE = re.compile(r'[\t\r\f\v]+')
+    _WS_NL_RE = re.compile(r'\n{3,}')
+    _WS_SPACE_RE = re.compile(r' {2,}')
+    _DOUBLE_QUOTE_RE = re.compile(r'[""„‟]')
+    _SINGLE_QUOTE_RE = re.compile(r"[''‚‛]")
+    _PUNCT_SPACE_RE = re.compile(r'\s+([.,!?;:])')
+    _PUNCT_AFTER_RE = re.compile(r'([.,!?;:])(?=[A-Za-z])')
+    _DOTS_RE = re.compile(r'\.{4,}')
+    _Q_RE = re.compile(r'\?{2,}')
+    _BANG_RE = re.compile(r'!{2,}')
+    _PAREN_OPEN_RE = re.compile(r'\(\s+')
+    _PAREN_CLOSE_RE = re.compile(r'\s+\)')
+    _BRACKET_OPEN_RE = re.compile(r'\[\s+')
+    _BRACKET_CLOSE_RE = re.compile(r'\s+\]')
+    
+    # Common HTML entities to decode
+    _ENTITY_MAP = {
+        '&nbsp;': ' ',
+        '&amp;': '&',
+        '&lt;': '<',
+        '&gt;': '>',
+        '&quot;': '"',
+        '&#39;': "'",
+        '&apos;': "'",
+        '&ndash;': '-',
+        '&mdash;': '-',
+        '&hellip;': '...',
+        '&copy;': '©',
+        '&reg;': '®',
+        '&trade;': '™'
+    }
+    _ENTITY_RE = re.compile('|'.join(map(re.escape, _ENTITY_MAP)))
+    
+    # Control characters (all but \t \n \r) are deleted and fancy quotes,
+    # dashes and symbols replaced, in one str.translate pass
+    _TRANSLATE = {
+        **dict.fromkeys([*range(0x00, 0x09), 0x0b, 0x0c, *range(0x0e, 0x20), *range(0x7f, 0xa0)]),
+        **str.maketrans({
+            '\u201c': '"',
+            '\u201d': '"',
+            '\u2018': "'",
+            '\u2019': "'",
+            '–': '-',
+            '—': '-',
+            '…': '...',
+            '•': '-',
+            '·': '-',
+            '→': '->',
+            '←': '<-',
+            '≈': '~',
+            '≠': '!=',
+            '≤': '<=',
+            '≥': '>=',
+        }),
+    }
     
     def clean(self, text: str) -> str:
         """
@@ -62,138 +130,90 @@ class TextCleaner:
     def remove_urls(self, text: str) -> str:
         """Remove URLs from text"""
         # Match http, https, ftp URLs
-        url_pattern = r'https?://\S+|www\.\S+|ftp://\S+'
-        text = re.sub(url_pattern, '', text)
-        return text
+        return self._URL_RE.sub('', text)
     
     def remove_emails(self, text: str) -> str:
         """Remove email addresses from text"""
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        text = re.sub(email_pattern, '', text)
-        return text
+        return self._EMAIL_RE.sub('', text)
     
     def remove_html_tags(self, text: str) -> str:
         """Remove HTML tags from text"""
         # Remove HTML tags
-        html_pattern = r'<[^>]+>'
-        text = re.sub(html_pattern, '', text)
-        
-        # Decode common HTML entities
-        html_entities = {
-            '&nbsp;': ' ',
-            '&amp;': '&',
-            '&lt;': '<',
-            '&gt;': '>',
-            '&quot;': '"',
-            '&#39;': "'",
-            '&apos;': "'",
-            '&ndash;': '-',
-            '&mdash;': '-',
-            '&hellip;': '...',
-            '&copy;': '©',
-            '&reg;': '®',
-            '&trade;': '™'
-        }
-        for entity, replacement in html_entities.items():
-            text = text.replace(entity, replacement)
+        text = self._HTML_TAG_RE.sub('', text)
         
-        return text
+        # Decode common HTML entities in a single pass
+        return self._ENTITY_RE.sub(lambda m: self._ENTITY_MAP[m.group(0)], text)
     
     def normalize_whitespace(self, text: str) -> str:
         """Normalize all whitespace characters"""
         # Replace various whitespace characters with standard space
-        text = re.sub(r'[\t\r\f\v]+', ' ', text)
+        text = self._WS_TABS_RE.sub(' ', text)
         
         # Replace multiple newlines with double newline (paragraph break)
-        text = re.sub(r'\n{3,}', '\n\n', text)
+        text = self._WS_NL_RE.sub('\n\n', text)
         
         # Replace multiple spaces with single space
-        text = re.sub(r' {2,}', ' ', text)
-        
-        return text
+        return self._WS_SPACE_RE.sub(' ', text)
     
     def remove_special_characters(self, text: str) -> str:
         """Remove or replace special characters"""
         # Keep basic punctuation and alphanumeric, remove weird symbols
         # But preserve sentence structure
         
-        # Remove control characters
-        text = re.sub(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f]', '', text)
-        
-        # Replace fancy quotes and dashes with standard ones
-        replacements = {
-            '"': '"',
-            '"': '"',
-            ''': "'",
-            ''': "'",
-            '–': '-',
-            '—': '-',
-            '…': '...',
-            '•': '-',
-            '·': '-',
-            '→': '->',
-            '←': '<-',
-            '≈': '~',
-            '≠': '!=',
-            '≤': '<=',
-            '≥': '>=',
-        }
-        for old, new in replacements.items():
-            text = text.replace(old, new)
-        
-        return text
+        # Remove control characters and replace fancy quotes and dashes
+        # with standard ones
+        return text.translate(self._TRANSLATE)
     
     def normalize_quotes(self, text: str) -> str:
         """Normalize quotation marks"""
         # Ensure consistent quote usage
-        text = re.sub(r'[""„‟]', '"', text)
-        text = re.sub(r"[''‚‛]", "'", text)
-        return text
+        text = self._DOUBLE_QUOTE_RE.sub('"', text)
+        return self._SINGLE_QUOTE_RE.sub("'", text)
     
     def fix_common_issues(self, text: str) -> str:
         """Fix common text issues"""
         # Fix spacing around punctuation
-        text = re.sub(r'\s+([.,!?;:])', r'\1', text)
-        text = re.sub(r'([.,!?;:])(?=[A-Za-z])', r'\1 ', text)
+        text = self._PUNCT_SPACE_RE.sub(r'\1', text)
+        text = self._PUNCT_AFTER_RE.sub(r'\1 ', text)
         
         # Fix multiple punctuation
-        text = re.sub(r'\.{4,}', '...', text)
-        text = re.sub(r'\?{2,}', '?', text)
-        text = re.sub(r'!{2,}', '!', text)
+        text = self._DOTS_RE.sub('...', text)
+        text = self._Q_RE.sub('?', text)
+        text = self._BANG_RE.sub('!', text)
         
         # Fix spacing around parentheses
-        text = re.sub(r'\(\s+', '(', text)
-        text = re.sub(r'\s+\)', ')', text)
+        text = self._PAREN_OPEN_RE.sub('(', text)
+        text = self._PAREN_CLOSE_RE.sub(')', text)
         
         # Fix spacing around brackets
-        text = re.sub(r'\[\s+', '[', text)
-        text = re.sub(r'\s+\]', ']', text)
-        
-        return text
+        text = self._BRACKET_OPEN_RE.sub('[', text)
+        return self._BRACKET_CLOSE_RE.sub(']', text)
     
     def expand_contractions(self, text: str) -> str:
         """Expand contractions (optional, not used by default)"""
-        for contraction, expansion in self.contractions.items():
-            text = re.sub(re.escape(contraction), expansion, text, flags=re.IGNORECASE)
+        for pattern, expansion in self._CONTRACTION_RES:
+            text = pattern.sub(expansion, text)
         return text
     
     def final_cleanup(self, text: str) -> str:
         """Final cleanup pass"""
         # Remove leading/trailing whitespace from each line
-        lines = text.split('\n')
-        lines = [line.strip() for line in lines]
+        lines = [line.strip() for line in text.split('\n')]
         
         # Remove empty lines at start and end
-        while lines and not lines[0]:
-            lines.pop(0)
-        while lines and not lines[-1]:
-            lines.pop()
+        start, end = 0, len(lines)
+        while start < end and not lines[start]:
+            start += 1
+        while end > start and not lines[end - 1]:
+            end -= 1
         
         # Rejoin
-        text = '\n'.join(lines)
+        text = '\n'.join(lines[start:end])
         
-        # Final whitespace normalization
-        text = re.sub(r' {2,}', ' ', text)
+        # Deleted control characters can leave double spaces behind; the
+        # substring check skips the regex in the common case
+        if '  ' in text:
+            text = self._WS_SPACE_RE.sub(' ', text)
         
         return text
     
@@ -211,6 +231,61 @@ class TextCleaner:
         }
 
 
+_CLEANER = TextCleaner()
+
+# Below this many texts, shipping them to worker processes costs more
+# than cleaning them in-process
+PARALLEL_MIN_TEXTS = 16
+
+# Every server worker gets its own pool, so keep each one small; 0 cleans
+# in-process only. Ignored under gevent (see _pool_usable).
+CLEAN_POOL_SIZE = int(os.getenv('CLEAN_POOL_SIZE', min(4, os.cpu_count() or 1)))
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def clean(text: str) -> str:
+    """Clean text with the shared module-level TextCleaner (picklable for worker pools)"""
+    return _CLEANER.clean(text)
+
+
+def _pool_usable() -> bool:
+    # In gunicorn's gevent workers threading is monkey-patched, so the
+    # pool's feeder and result threads become greenlets, and a batch of
+    # large texts deadlocks the worker. Checked without importing gevent.
+    monkey = sys.modules.get('gevent.monkey')
+    return CLEAN_POOL_SIZE > 0 and not (monkey and monkey.is_module_patched('threading'))
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    # Pool processes come from a forkserver rather than forking this
+    # process, which already has the background loop and writer threads
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=CLEAN_POOL_SIZE,
+                                        mp_context=multiprocessing.get_context('forkserver'))
+        return _pool
+
+
+def clean_many(texts: list, clean_one: Callable[[str], str] = clean) -> list:
+    """
+    Clean several texts, spreading large batches over worker processes
+    
+    Args:
+        texts: Raw input texts
+        clean_one: Cleans one text when the batch is cleaned in-process
+                   (e.g. a memoized wrapper)
+        
+    Returns:
+        Cleaned texts, in input order
+    """
+    if len(texts) < PARALLEL_MIN_TEXTS or not _pool_usable():
+        return [clean_one(text) for text in texts]
+    return list(_get_pool().map(clean, texts, chunksize=8))
+
+
 # Testing
 if __name__ == '__main__':
     cleaner = TextCleaner()
@@ -0,0 +1,66 @@
+"""
+Background Writer Module
+Persists JSON output files on a daemon thread, off the request path
+"""
+
+import os
+import queue
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+def write_atomic(path: str, payload: bytes):
+    """Write payload to path via a temp file and rename, so readers never see a partial file"""
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, 'wb', buffering=1 << 20) as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+class BackgroundWriter:
+    """
+    Queue of (path, bytes) writes drained by a single daemon thread
+    """
+    
+    def __init__(self):
+        self.queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+    
+    def submit(self, path: str, payload: bytes):
+        """Queue payload to be written to path and return immediately"""
+        self._ensure_started()
+        self.queue.put((path, payload))
+    
+    def flush(self):
+        """Block until every queued write has been performed"""
+        self.queue.join()
+    
+    def _ensure_started(self):
+        # Threads don't survive fork, so a worker process starts its own on first submit
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='json-writer', daemon=True)
+                self._thread.start()
+    
+    def _run(self):
+        while True:
+            path, payload = self.queue.get()
+            try:
+                write_atomic(path, payload)
+                logger.info(f"Saved {path}")
+            except Exception as e:
+                logger.error(f"Failed to write {path}: {str(e)}")
+            finally:
+                self.queue.task_done()
+
+
+# Shared writer used by the API
+writer = BackgroundWriter()